@@ -0,0 +1,5 @@
+"""Page areas of the school site, one blueprint (`bp`) per module.
+
+create_app() in app.py imports the areas listed in SCHOOL_AREAS and registers
+them; see "Application areas" there.
+"""
@@ -0,0 +1,810 @@
+"""Admin area: dashboard, people, admissions, fees, jobs, exports, audit logs and operations pages."""
+from flask import current_app, flash, jsonify, redirect, render_template, request, Response, session, url_for
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+import json
+import os
+import time
+
+from app import (
+    _EXPORT_FILE_RE, _gen_admission_password, _mask_db_url, academic_year_of, admin_export_response,
+    ADMIN_JOB_KINDS, admin_required, Admission, AreaBlueprint, AUDITED_TABLES, cache, cancel_job, catalog_classes,
+    change_as_dict, change_audit_page, collect_metric_snapshots, confirm_admission_identity, create_identity,
+    current_tenant, dashboard_counters, db, delete_identity, dues_report, enqueue_job, ensure_identity,
+    exports_dir, FeeSchedule, Job, job_as_dict, JOB_HANDLERS, JOB_STATUSES, LoginAudit, metrics,
+    NotificationOutbox, observe_export, pool_snapshot, replica_reads, ROLE_MODELS, set_identity_password,
+    start_admin_export, Student, student_report_card, Teacher, tenant_engines, update_identity, User,
+    username_taken,
+)
+
+bp = AreaBlueprint('admin', __name__)
+
+
+@bp.route('/admin/login', methods=['GET', 'POST'])
+def admin_login():
+    if request.method == 'POST':
+        username = request.form.get('username', '').strip()
+        password = request.form.get('password', '')
+        u = User.query.filter_by(role='admin', username=username).first()
+        if not u or not u.check_password(password):
+            # Keep only the latest audit entry per user
+            LoginAudit.query.filter_by(user_type='admin', username=username).delete()
+            db.session.add(LoginAudit(
+                user_type='admin', username=username, user_id=u.id if u else None,
+                success=False, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+            ))
+            db.session.commit()
+            flash('Invalid username or password', 'danger')
+            return redirect(url_for('admin_login'))
+
+        # Map to existing Admin record for dashboard compatibility
+        a, _ = ensure_identity('admin', username, name=u.name or username, email=u.email, user=u)
+
+        session['admin_id'] = a.id
+        session.permanent = True
+        # Keep only the latest audit entry per user
+        LoginAudit.query.filter_by(user_type='admin', username=username).delete()
+        db.session.add(LoginAudit(
+            user_type='admin', username=username, user_id=u.id,
+            success=True, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+        ))
+        db.session.commit()
+        return redirect(url_for('admin_dashboard'))
+    return render_template('admin_login.html')
+
+
+@bp.route('/admin/logout')
+@admin_required
+def admin_logout():
+    session.pop('admin_id', None)
+    flash('Logged out', 'info')
+    return redirect(url_for('admin_login'))
+
+
+@bp.route('/admin/dashboard')
+@admin_required
+def admin_dashboard():
+    # Totals come from the maintained counters table; recent logins use the timestamp index
+    counters = dashboard_counters()
+    last_logins = LoginAudit.query.order_by(LoginAudit.timestamp.desc()).limit(10).all()
+    return render_template('admin_dashboard.html', teacher_count=counters['teachers'], student_count=counters['students'],
+                           users_count=counters['users'], admissions_count=counters['admissions_confirmed'], last_logins=last_logins)
+
+
+# ------- Admin: DB connection pool -------
+@bp.route('/admin/db/pool')
+@admin_required
+def admin_db_pool():
+    snap = pool_snapshot()
+    if current_app.config.get('TENANT_MODE'):
+        snap['tenant'] = current_tenant()
+        snap['tenant_engines'] = tenant_engines.stats()
+    if (request.args.get('format') or '').strip() == 'json':
+        return jsonify(snap)
+    engine_opts = {k: (v.__name__ if isinstance(v, type) else v)
+                   for k, v in current_app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}).items()}
+    return render_template('admin_db_pool.html', snap=snap, engine_opts=engine_opts,
+                           db_url=_mask_db_url(current_app.config.get('SQLALCHEMY_DATABASE_URI')))
+
+
+# ------- Admin: Cache -------
+@bp.route('/admin/cache')
+@admin_required
+def admin_cache():
+    stats = cache.stats()
+    if (request.args.get('format') or '').strip() == 'json':
+        return jsonify(stats)
+    settings = {k: current_app.config.get(k) for k in ('CACHE_BACKEND', 'CACHE_DEFAULT_TTL', 'CACHE_MAX_ENTRIES',
+                                               'COUNTERS_CACHE_SECONDS', 'CLASS_CATALOG_CACHE_SECONDS')}
+    return render_template('admin_cache.html', stats=stats, settings=settings)
+
+
+@bp.route('/admin/cache/clear', methods=['POST'])
+@admin_required
+def admin_cache_clear():
+    cache.clear()
+    flash('Cache cleared', 'success')
+    return redirect(url_for('admin_cache'))
+
+
+# ------- Admin: Prometheus metrics -------
+@bp.route('/admin/metrics')
+def admin_metrics():
+    # Scrapers authenticate with METRICS_TOKEN; browsers use the admin session
+    token = current_app.config.get('METRICS_TOKEN')
+    auth = request.headers.get('Authorization') or ''
+    if 'admin_id' not in session and not (token and auth == f'Bearer {token}'):
+        return Response('unauthorized\n', status=401, mimetype='text/plain')
+
+    pool = pool_snapshot()
+    cache_stats = cache.stats()
+    pid = {'pid': str(os.getpid())}
+    gauges = [
+        ('school_db_pool_checked_out', 'Connections currently checked out (this worker).',
+         [(pid, pool.get('checked_out', 0))]),
+        ('school_db_pool_overflow', 'Overflow connections open beyond pool_size (this worker).',
+         [(pid, pool.get('overflow', 0))]),
+        ('school_db_pool_checkout_wait_seconds_max', 'Longest pool checkout wait seen (this worker).',
+         [(pid, pool['wait_max'])]),
+        ('school_db_pool_checkout_timeouts', 'Pool checkouts that timed out (this worker).',
+         [(pid, pool['timeouts'])]),
+        ('school_tenant_engines', 'Tenant database engines open in this worker.',
+         [(pid, len(tenant_engines.open_engines()))]),
+        ('school_cache_entries', 'Entries held by the cache backend.',
+         [({**pid, 'backend': cache_stats['backend']}, cache_stats['entries'] or 0)]),
+        ('school_cache_evictions', 'Entries the cache backend evicted to stay within CACHE_MAX_ENTRIES.',
+         [({**pid, 'backend': cache_stats['backend']}, cache_stats['evictions'] or 0)]),
+        ('school_jobs', 'Background jobs waiting or running.',
+         [({'status': st}, n) for st, n in db.session.query(Job.status, db.func.count(Job.id))
+          .filter(Job.status.in_(('queued', 'running'))).group_by(Job.status)]),
+    ]
+    body = metrics.render(collect_metric_snapshots(), gauges)
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
+
+# ------- Admin: Fees and dues -------
+@bp.route('/admin/fees')
+@admin_required
+@replica_reads
+def admin_fees():
+    cls = (request.args.get('class') or '').strip() or None
+    started = time.perf_counter()
+    rows = dues_report(cls)
+    report_ms = (time.perf_counter() - started) * 1000
+    if (request.args.get('format') or '').strip() == 'json':
+        return jsonify({'class': cls, 'rows': rows})
+    totals = {k: sum(r[k] or 0 for r in rows) for k in ('charged', 'paid')} if not cls else {}
+    if not cls:
+        totals['outstanding'] = sum(r['outstanding'] or 0 for r in rows)
+        totals['students_due'] = sum(r['students_due'] or 0 for r in rows)
+    schedules = FeeSchedule.query.order_by(FeeSchedule.academic_year.desc(), FeeSchedule.class_name,
+                                           FeeSchedule.due_date).limit(200).all()
+    class_list = catalog_classes()
+    return render_template('admin_fees.html', rows=rows, cls=cls, totals=totals, schedules=schedules,
+                           class_list=class_list, report_ms=report_ms,
+                           current_year=academic_year_of(datetime.utcnow().date()))
+
+
+@bp.route('/admin/fees/schedules', methods=['POST'])
+@admin_required
+def admin_fees_schedule_new():
+    try:
+        sched = FeeSchedule(class_name=(request.form.get('class_name') or '').strip(),
+                            academic_year=int(request.form.get('academic_year') or 0),
+                            name=(request.form.get('name') or '').strip(),
+                            amount=float(request.form.get('amount') or 0),
+                            due_date=datetime.strptime(request.form.get('due_date') or '', '%Y-%m-%d').date())
+    except ValueError:
+        flash('Enter a valid academic year, amount and due date', 'danger')
+        return redirect(url_for('admin_fees'))
+    if not sched.class_name or not sched.name or sched.amount <= 0:
+        flash('Class, name and a positive amount are required', 'danger')
+        return redirect(url_for('admin_fees'))
+    db.session.add(sched)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        flash('A schedule with that name already exists for this class and year', 'danger')
+        return redirect(url_for('admin_fees'))
+    flash('Fee schedule added. Charges are posted once it falls due.', 'success')
+    return redirect(url_for('admin_fees'))
+
+
+@bp.route('/admin/fees/post-charges', methods=['POST'])
+@admin_required
+def admin_fees_post_charges():
+    job = enqueue_job('fees.post_charges', priority=5, created_by=f"admin:{session.get('admin_id')}")
+    if job.status == 'succeeded':
+        flash(f"Posted {json.loads(job.result)['posted']} fee charges", 'success')
+    else:
+        flash(f'Posting due fee charges in the background (job #{job.id})', 'success')
+    return redirect(url_for('admin_fees'))
+
+
+# ------- Admin: Background jobs -------
+@bp.route('/admin/jobs')
+@admin_required
+def admin_jobs():
+    status = (request.args.get('status') or '').strip() or None
+    kind = (request.args.get('kind') or '').strip() or None
+    q = Job.query
+    if status:
+        q = q.filter(Job.status == status)
+    if kind:
+        q = q.filter(Job.kind == kind)
+    jobs = q.order_by(Job.id.desc()).limit(100).all()
+    counts = dict(db.session.query(Job.status, db.func.count(Job.id)).group_by(Job.status).all())
+    outbox = dict(db.session.query(NotificationOutbox.status, db.func.count(NotificationOutbox.id))
+                  .group_by(NotificationOutbox.status).all())
+    if (request.args.get('format') or '').strip() == 'json':
+        return jsonify({'counts': counts, 'outbox': outbox, 'jobs': [job_as_dict(j) for j in jobs]})
+    return render_template('admin_jobs.html', jobs=jobs, counts=counts, statuses=JOB_STATUSES, outbox=outbox,
+                           status=status, kind=kind, kinds=sorted(JOB_HANDLERS), admin_kinds=ADMIN_JOB_KINDS)
+
+
+@bp.route('/admin/jobs/<int:job_id>')
+@admin_required
+def admin_job_detail(job_id):
+    job = db.session.get(Job, job_id)
+    if job is None:
+        return jsonify({'error': 'job not found'}), 404
+    return jsonify(job_as_dict(job))
+
+
+@bp.route('/admin/jobs/enqueue', methods=['POST'])
+@admin_required
+def admin_jobs_enqueue():
+    kind = (request.form.get('kind') or '').strip()
+    if kind not in ADMIN_JOB_KINDS:
+        flash('Unknown job', 'error')
+        return redirect(url_for('admin_jobs'))
+    job = enqueue_job(kind, priority=request.form.get('priority', type=int) or 0,
+                      created_by=f"admin:{session.get('admin_id')}")
+    flash(f'Queued job #{job.id}: {ADMIN_JOB_KINDS[kind]}', 'success')
+    return redirect(url_for('admin_jobs'))
+
+
+@bp.route('/admin/jobs/<int:job_id>/retry', methods=['POST'])
+@admin_required
+def admin_job_retry(job_id):
+    job = db.session.get(Job, job_id)
+    if job is None or job.status not in ('failed', 'cancelled'):
+        flash('Only failed or cancelled jobs can be retried', 'error')
+        return redirect(url_for('admin_jobs'))
+    job.status, job.attempts, job.run_after = 'queued', 0, datetime.utcnow()
+    job.error = job.finished_at = job.worker = None
+    db.session.commit()
+    flash(f'Job #{job.id} queued again', 'success')
+    return redirect(url_for('admin_jobs'))
+
+
+@bp.route('/admin/jobs/<int:job_id>/cancel', methods=['POST'])
+@admin_required
+def admin_job_cancel(job_id):
+    outcome = cancel_job(job_id)
+    if outcome == 'cancelled':
+        flash(f'Job #{job_id} cancelled', 'success')
+    elif outcome == 'requested':
+        flash(f'Cancellation requested for job #{job_id}', 'success')
+    else:
+        flash('Only queued or running jobs can be cancelled', 'error')
+    return redirect(url_for('admin_jobs'))
+
+
+# ------- Admin: Export artifacts -------
+@bp.route('/admin/exports')
+@admin_required
+def admin_exports():
+    jobs = Job.query.filter(Job.kind == 'admin.export').order_by(Job.id.desc()).limit(50).all()
+    exports = []
+    for job in jobs:
+        entry = job_as_dict(job)
+        result = entry['result'] or {}
+        entry['available'] = bool(result.get('file')) and os.path.exists(
+            os.path.join(exports_dir(), result['file']))
+        exports.append(entry)
+    return render_template('admin_exports.html', exports=exports,
+                           refresh=any(e['status'] in ('queued', 'running') for e in exports))
+
+
+@bp.route('/admin/exports/files/<filename>')
+@admin_required
+def admin_export_download(filename):
+    from flask import send_file
+    match = _EXPORT_FILE_RE.match(filename)
+    path = os.path.join(exports_dir(), filename)
+    if not match or not os.path.exists(path):
+        flash('That export is no longer available; start it again.', 'error')
+        return redirect(url_for('admin_exports'))
+    name, ext = match.group(1), match.group(2)
+    # conditional=True gives Range/206 and ETag/304 handling for resumed downloads
+    return send_file(path, mimetype='application/gzip' if ext == 'csv.gz' else 'text/csv', as_attachment=True,
+                     download_name=f"{name}.{ext}", conditional=True, max_age=0)
+
+
+# ------- Admin: Students -------
+@bp.route('/admin/students')
+@admin_required
+@replica_reads
+def admin_students_list():
+    page = max(int(request.args.get('page', 1) or 1), 1)
+    per_page = 25
+    q = (request.args.get('q') or '').strip()
+    # If use_admissions=1 (default), we list from Admission table (all statuses),
+    # so "whatever admission records are there" appear in the Students list view.
+    use_admissions = (request.args.get('use_admissions', '1') or '1').strip()
+    admissions_only = (request.args.get('admissions_only', '0') or '0').strip()
+
+    if use_admissions in ('1','true','yes','on'):
+        # Source rows from Admission table so every application shows, regardless of status
+        query = Admission.query
+        if q:
+            like = f"%{q}%"
+            query = query.filter(db.or_(Admission.name.ilike(like), Admission.roll_no.ilike(like)))
+        total = query.count()
+        rows = query.order_by(Admission.admission_date.desc()).offset((page-1)*per_page).limit(per_page).all()
+        pages = (total + per_page - 1) // per_page
+        # Render using the same template; it references fields (roll_no, name, class_name, section, phone, email) that Admission also has
+        return render_template('admin_students.html', students=rows, page=page, pages=pages, total=total, q=q, admissions_only=use_admissions)
+    else:
+        # Legacy: list from Student table; optionally restrict to confirmed admissions
+        query = Student.query
+        if admissions_only in ('1', 'true', 'yes', 'on'):
+            query = query.join(Admission, Admission.roll_no == Student.roll_no).filter(Admission.status == 'confirmed')
+        if q:
+            like = f"%{q}%"
+            query = query.filter(
+                db.or_(Student.roll_no.ilike(like), Student.name.ilike(like), Student.email.ilike(like))
+            )
+        total = query.count()
+        students = query.order_by(Student.class_name, Student.section, Student.roll_no).offset((page-1)*per_page).limit(per_page).all()
+        pages = (total + per_page - 1) // per_page
+        return render_template('admin_students.html', students=students, page=page, pages=pages, total=total, q=q, admissions_only=admissions_only)
+
+
+@bp.route('/admin/students/export')
+@admin_required
+@replica_reads
+@observe_export('students')
+def admin_students_export():
+    filters = {'q': (request.args.get('q') or '').strip()}
+    if request.args.get('async'):
+        return start_admin_export('students', filters)
+    return admin_export_response('students', filters)
+
+
+@bp.route('/admin/students/<int:student_id>/report-card')
+@admin_required
+@replica_reads
+def admin_student_report_card(student_id):
+    # Historical report card across live and archived academic years (JSON)
+    student = Student.query.get(student_id)
+    if not student:
+        return jsonify({'error': 'student not found'}), 404
+    year = request.args.get('year', type=int)
+    return jsonify({'student': {'id': student.id, 'roll_no': student.roll_no, 'name': student.name,
+                                'class_name': student.class_name, 'section': student.section},
+                    'years': student_report_card(student.id, year)})
+
+
+# ------- Admin: Teachers -------
+@bp.route('/admin/teachers')
+@admin_required
+@replica_reads
+def admin_teachers_list():
+    page = max(int(request.args.get('page', 1) or 1), 1)
+    per_page = 25
+    q = (request.args.get('q') or '').strip()
+
+    query = Teacher.query
+    if q:
+        like = f"%{q}%"
+        query = query.filter(
+            db.or_(Teacher.username.ilike(like), Teacher.name.ilike(like), Teacher.email.ilike(like))
+        )
+    total = query.count()
+    teachers = query.order_by(Teacher.username).offset((page-1)*per_page).limit(per_page).all()
+    # Build a username->User map to expose phone/email in template if needed
+    usernames = [t.username for t in teachers]
+    users = {u.username: u for u in User.query.filter(User.role=='teacher', User.username.in_(usernames)).all()}
+    pages = (total + per_page - 1) // per_page
+    return render_template('admin_teachers.html', teachers=teachers, users=users, page=page, pages=pages, total=total, q=q)
+
+
+@bp.route('/admin/teachers/new', methods=['GET', 'POST'])
+@admin_required
+def admin_teachers_new():
+    if request.method == 'POST':
+        username = (request.form.get('username') or '').strip()
+        name = (request.form.get('name') or '').strip() or username
+        email = (request.form.get('email') or '').strip() or None
+        phone = (request.form.get('phone') or '').strip() or None
+
+        if not username:
+            flash('Username is required', 'danger')
+            return redirect(url_for('admin_teachers_new'))
+
+        # Avoid duplicates (check across ALL users regardless of role)
+        if username_taken('teacher', username):
+            flash('Username already exists. Please choose a different username.', 'danger')
+            return redirect(url_for('admin_teachers_new'))
+
+        # Generate teacher password (reuse admission generator using phone if available, else username)
+        contact = phone or username
+        gen_password = _gen_admission_password(name, contact)
+
+        # Create unified User and Teacher record (shared password hash) in one transaction
+        try:
+            create_identity('teacher', username, name, gen_password, email=email, phone=phone,
+                            initial_password=gen_password)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            flash('Username already exists. Please choose a different username.', 'danger')
+            return redirect(url_for('admin_teachers_new'))
+
+        flash(f'Teacher created. Initial password: {gen_password}', 'success')
+        return redirect(url_for('admin_teachers_list'))
+
+    return render_template('admin_teacher_new.html')
+
+@bp.route('/admin/teachers/export')
+@admin_required
+@replica_reads
+@observe_export('teachers')
+def admin_teachers_export():
+    filters = {'q': (request.args.get('q') or '').strip()}
+    if request.args.get('async'):
+        return start_admin_export('teachers', filters)
+    return admin_export_response('teachers', filters)
+
+
+@bp.route('/admin/teachers/<username>/edit', methods=['GET','POST'])
+@admin_required
+def admin_teachers_edit(username):
+    t = Teacher.query.filter_by(username=username).first_or_404()
+    u = User.query.filter_by(role='teacher', username=username).first()
+    if request.method == 'POST':
+        name = (request.form.get('name') or '').strip() or t.name
+        email = (request.form.get('email') or '').strip() or None
+        phone = (request.form.get('phone') or '').strip() or None
+
+        update_identity(t, u, name=name, email=email, phone=phone)
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            flash('Failed to update teacher', 'danger')
+            return redirect(url_for('admin_teachers_edit', username=username))
+
+        flash('Teacher updated', 'success')
+        return redirect(url_for('admin_teachers_list'))
+
+    # GET
+    return render_template('admin_teacher_edit.html', teacher=t, user=u)
+
+
+@bp.route('/admin/teachers/<username>/delete', methods=['POST'])
+@admin_required
+def admin_teachers_delete(username):
+    t = Teacher.query.filter_by(username=username).first()
+    u = User.query.filter_by(role='teacher', username=username).first()
+    try:
+        delete_identity(t, u)
+        db.session.commit()
+        flash('Teacher deleted', 'success')
+    except Exception:
+        db.session.rollback()
+        flash('Failed to delete teacher', 'danger')
+    return redirect(url_for('admin_teachers_list'))
+
+
+@bp.route('/admin/teachers/<username>/reset_password', methods=['POST'])
+@admin_required
+def admin_teachers_reset_password(username):
+    t = Teacher.query.filter_by(username=username).first_or_404()
+    u = User.query.filter_by(role='teacher', username=username).first()
+    # Generate new password using name+phone (if known)
+    contact = (u.phone if u else None) or username
+    gen_password = _gen_admission_password(t.name, contact)
+    try:
+        # keep Teacher.password_hash in sync for dashboard compatibility
+        set_identity_password(t, u, gen_password)
+        db.session.commit()
+        flash(f'Password reset. New password: {gen_password}', 'success')
+    except Exception:
+        db.session.rollback()
+        flash('Failed to reset password', 'danger')
+    return redirect(url_for('admin_teachers_list'))
+
+
+# ------- Admin: Login Audit (filters + pagination) -------
+@bp.route('/admin/audit')
+@admin_required
+@replica_reads
+def admin_audit():
+    page = max(int(request.args.get('page', 1) or 1), 1)
+    per_page = 25
+    q = (request.args.get('q') or '').strip()
+    role = (request.args.get('role') or '').strip()  # 'student'|'teacher'|'admin'|''
+    success_param = (request.args.get('success') or '').strip()  # '1'|'0'|''
+
+    query = LoginAudit.query
+    if q:
+        like = f"%{q}%"
+        query = query.filter(LoginAudit.username.ilike(like))
+    if role:
+        query = query.filter(LoginAudit.user_type == role)
+    if success_param in ('0', '1'):
+        query = query.filter(LoginAudit.success == (success_param == '1'))
+
+    total = query.count()
+    logs = query.order_by(LoginAudit.timestamp.desc()).offset((page-1)*per_page).limit(per_page).all()
+    pages = (total + per_page - 1) // per_page
+    return render_template('admin_audit.html', logs=logs, page=page, pages=pages, total=total, q=q, role=role, success_param=success_param)
+
+
+# ------- Admin: Change audit (filters + keyset pagination) -------
+@bp.route('/admin/changes')
+@admin_required
+@replica_reads
+def admin_changes():
+    args = request.args
+    filters = {'table': (args.get('table') or '').strip() or None,
+               'action': (args.get('action') or '').strip() or None,
+               'actor': (args.get('actor') or '').strip() or None,
+               'student_id': None, 'since': None, 'until': None}
+    student = (args.get('student') or '').strip()
+    if student:
+        # Roll number or student id
+        found = Student.query.filter_by(roll_no=student).first()
+        filters['student_id'] = found.id if found else (int(student) if student.isdigit() else -1)
+    for key in ('since', 'until'):
+        try:
+            filters[key] = datetime.strptime(args.get(key) or '', '%Y-%m-%d') if args.get(key) else None
+        except ValueError:
+            flash(f'{key} must be YYYY-MM-DD', 'error')
+    limit = min(max(args.get('limit', type=int) or current_app.config.get('AUDIT_PAGE_SIZE') or 50, 1), 500)
+    entries, next_before = change_audit_page(filters, before=args.get('before', type=int), limit=limit)
+    if (args.get('format') or '').strip() == 'json':
+        return jsonify({'changes': [change_as_dict(c) for c in entries], 'next_before': next_before})
+    names = dict(db.session.query(Student.id, Student.name).filter(
+        Student.id.in_({c.student_id for c in entries if c.student_id}))) if entries else {}
+    params = {k: v for k, v in args.items() if k not in ('before', 'format') and v}
+    return render_template('admin_changes.html', entries=entries, names=names, next_before=next_before,
+                           params=params, tables=AUDITED_TABLES, first_page=not args.get('before'),
+                           decode=lambda v: json.loads(v) if v else {})
+
+
+# ------- Admin: Admissions -------
+@bp.route('/admin/admissions')
+@admin_required
+@replica_reads
+def admin_admissions_list():
+    page = max(int(request.args.get('page', 1) or 1), 1)
+    per_page = 25
+    q = (request.args.get('q') or '').strip()
+    status = (request.args.get('status') or '').strip()
+
+    query = Admission.query
+    if q:
+        like = f"%{q}%"
+        query = query.filter(db.or_(Admission.name.ilike(like), Admission.roll_no.ilike(like)))
+    if status:
+        query = query.filter(Admission.status == status)
+    total = query.count()
+    rows = query.order_by(Admission.admission_date.desc()).offset((page-1)*per_page).limit(per_page).all()
+    pages = (total + per_page - 1) // per_page
+    return render_template('admin_admissions.html', rows=rows, page=page, pages=pages, total=total, q=q, status=status)
+
+
+@bp.route('/admin/admissions/new', methods=['GET', 'POST'])
+@admin_required
+def admin_admissions_new():
+    if request.method == 'POST':
+        name = (request.form.get('name') or '').strip()
+        class_name = (request.form.get('class_name') or '').strip() or None
+        section = (request.form.get('section') or '').strip() or None
+        phone = (request.form.get('phone') or '').strip() or None
+        email = (request.form.get('email') or '').strip() or None
+        address = (request.form.get('address') or '').strip() or None
+        status = (request.form.get('status') or 'pending').strip()
+        roll_no = (request.form.get('roll_no') or '').strip() or None
+
+        if not name:
+            flash('Name is required', 'danger')
+            return redirect(url_for('admin_admissions_new'))
+
+        # Prevent duplicate roll numbers at the Admission table level
+        if roll_no:
+            existing = Admission.query.filter(Admission.roll_no == roll_no).first()
+            if existing:
+                flash('Roll No already exists in another admission. Please use a unique Roll No.', 'danger')
+                return redirect(url_for('admin_admissions_new'))
+
+        # Generate password for admission using school name + student name + last digits of phone
+        gen_password = _gen_admission_password(name, phone) if phone else None
+        
+        adm = Admission(name=name, class_name=class_name, section=section, phone=phone,
+                        email=email, address=address, status=status, roll_no=roll_no,
+                        password=gen_password)
+        db.session.add(adm)
+        try:
+            # If confirmed, create Student + User (if not present) in the same transaction
+            if status == 'confirmed' and roll_no:
+                confirm_admission_identity(adm)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            flash('Failed to save admission (possible duplicate Roll No).', 'danger')
+            return redirect(url_for('admin_admissions_new'))
+
+        if status == 'confirmed' and not roll_no:
+            flash('Confirmed admission requires Roll No. Please edit and add roll no.', 'warning')
+
+        flash('Admission saved', 'success')
+        return redirect(url_for('admin_admissions_list'))
+
+    return render_template('admin_admissions_new.html')
+
+
+@bp.route('/admin/admissions/<int:adm_id>/edit', methods=['GET', 'POST'])
+@admin_required
+def admin_admissions_edit(adm_id):
+    adm = Admission.query.get_or_404(adm_id)
+    if request.method == 'POST':
+        name = (request.form.get('name') or '').strip()
+        class_name = (request.form.get('class_name') or '').strip() or None
+        section = (request.form.get('section') or '').strip() or None
+        phone = (request.form.get('phone') or '').strip() or None
+        email = (request.form.get('email') or '').strip() or None
+        address = (request.form.get('address') or '').strip() or None
+        status = (request.form.get('status') or 'pending').strip()
+        roll_no = (request.form.get('roll_no') or '').strip() or None
+
+        if not name:
+            flash('Name is required', 'danger')
+            return redirect(url_for('admin_admissions_edit', adm_id=adm.id))
+
+        adm.name = name
+        adm.class_name = class_name
+        adm.section = section
+        adm.phone = phone
+        adm.email = email
+        adm.address = address
+        adm.status = status
+        # Auto-generate admission password if missing and phone is provided
+        if not (adm.password or '').strip() and phone:
+            adm.password = _gen_admission_password(name, phone)
+        # Prevent duplicate roll numbers when editing
+        if roll_no:
+            dup = Admission.query.filter(Admission.roll_no == roll_no, Admission.id != adm.id).first()
+            if dup:
+                flash('Roll No already exists in another admission. Please use a unique Roll No.', 'danger')
+                return redirect(url_for('admin_admissions_edit', adm_id=adm.id))
+        adm.roll_no = roll_no
+        try:
+            # If moved/kept to confirmed, ensure student/user linkage in the same transaction
+            if status == 'confirmed' and roll_no:
+                confirm_admission_identity(adm)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            flash('Failed to update admission (possible duplicate Roll No).', 'danger')
+            return redirect(url_for('admin_admissions_edit', adm_id=adm.id))
+
+        if status == 'confirmed' and not roll_no:
+            flash('Confirmed admission requires Roll No.', 'warning')
+
+        flash('Admission updated', 'success')
+        return redirect(url_for('admin_admissions_list'))
+
+    return render_template('admin_admissions_edit.html', adm=adm)
+
+
+@bp.route('/admin/admissions/<int:adm_id>/status', methods=['POST'])
+@admin_required
+def admin_admissions_status(adm_id):
+    adm = Admission.query.get_or_404(adm_id)
+    status = (request.form.get('status') or '').strip()
+    roll_no = (request.form.get('roll_no') or '').strip() or adm.roll_no
+
+    if status not in ('pending', 'confirmed', 'rejected'):
+        flash('Invalid status', 'danger')
+        return redirect(url_for('admin_admissions_list'))
+
+    # Prevent duplicate roll numbers when updating status
+    if roll_no:
+        dup = Admission.query.filter(Admission.roll_no == roll_no, Admission.id != adm.id).first()
+        if dup:
+            flash('Roll No already exists in another admission. Please use a unique Roll No.', 'danger')
+            return redirect(url_for('admin_admissions_list'))
+
+    adm.status = status
+    if roll_no:
+        adm.roll_no = roll_no
+    # Ensure we have an admission password if confirming and missing
+    if status == 'confirmed' and (not (adm.password or '').strip()):
+        adm.password = _gen_admission_password(adm.name, adm.phone)
+    try:
+        # Ensure student and unified user exist, committed together with the status
+        if status == 'confirmed' and adm.roll_no:
+            confirm_admission_identity(adm)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        flash('Failed to update status (possible duplicate Roll No).', 'danger')
+        return redirect(url_for('admin_admissions_list'))
+
+    if status == 'confirmed' and not adm.roll_no:
+        flash('Confirmed admission requires Roll No.', 'warning')
+        return redirect(url_for('admin_admissions_list'))
+
+    flash('Admission status updated', 'success')
+    return redirect(url_for('admin_admissions_list'))
+
+
+@bp.route('/admin/admissions/<int:adm_id>/delete', methods=['POST'])
+@admin_required
+def admin_admissions_delete(adm_id):
+    adm = Admission.query.get_or_404(adm_id)
+    db.session.delete(adm)
+    db.session.commit()
+    flash('Admission deleted', 'info')
+    return redirect(url_for('admin_admissions_list'))
+
+
+@bp.route('/admin/admissions/export')
+@admin_required
+@replica_reads
+@observe_export('admissions')
+def admin_admissions_export():
+    filters = {'q': (request.args.get('q') or '').strip(), 'status': (request.args.get('status') or '').strip()}
+    if request.args.get('async'):
+        return start_admin_export('admissions', filters)
+    return admin_export_response('admissions', filters)
+
+
+# ------- Admin: Users list and export -------
+@bp.route('/admin/users')
+@admin_required
+@replica_reads
+def admin_users_list():
+    page = max(int(request.args.get('page', 1) or 1), 1)
+    per_page = 25
+    q = (request.args.get('q') or '').strip()
+    role = (request.args.get('role') or '').strip()
+
+    query = User.query
+    if q:
+        like = f"%{q}%"
+        query = query.filter(db.or_(User.username.ilike(like), User.name.ilike(like), User.email.ilike(like)))
+    if role:
+        query = query.filter(User.role == role)
+    total = query.count()
+    rows = query.order_by(User.role, User.username).offset((page-1)*per_page).limit(per_page).all()
+    pages = (total + per_page - 1) // per_page
+    return render_template('admin_users.html', rows=rows, page=page, pages=pages, total=total, q=q, role=role)
+
+
+@bp.route('/admin/users/export')
+@admin_required
+@replica_reads
+@observe_export('users')
+def admin_users_export():
+    filters = {'q': (request.args.get('q') or '').strip(), 'role': (request.args.get('role') or '').strip()}
+    if request.args.get('async'):
+        return start_admin_export('users', filters)
+    return admin_export_response('users', filters)
+
+
+# ------- Admin: Reset user password -------
+@bp.route('/admin/users/<int:user_id>/reset-password', methods=['GET', 'POST'])
+@admin_required
+def admin_user_reset_password(user_id):
+    u = User.query.get_or_404(user_id)
+    if request.method == 'POST':
+        new_password = (request.form.get('new_password') or '')
+        confirm_password = (request.form.get('confirm_password') or '')
+        if not new_password or new_password != confirm_password:
+            flash('Passwords do not match or empty', 'danger')
+            return redirect(url_for('admin_user_reset_password', user_id=u.id))
+
+        # Update the role-specific record in the same transaction for dashboard compatibility
+        record = None
+        if u.role in ROLE_MODELS:
+            model, key = ROLE_MODELS[u.role]
+            record = model.query.filter(getattr(model, key) == u.username).first()
+        set_identity_password(record, u, new_password)
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            flash('Failed to update password', 'danger')
+            return redirect(url_for('admin_user_reset_password', user_id=u.id))
+
+        flash('Password updated successfully', 'success')
+        return redirect(url_for('admin_users_list'))
+
+    return render_template('admin_user_reset.html', user=u)
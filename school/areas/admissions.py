@@ -0,0 +1,56 @@
+"""Admissions area: the public online application API."""
+from flask import jsonify, request
+
+from app import _gen_admission_password, Admission, AreaBlueprint, db
+
+bp = AreaBlueprint('admissions', __name__)
+
+
+# -------- Public: Online Admission Application --------
+@bp.route('/admissions/apply', methods=['POST'])
+def public_admission_apply():
+    """Accept an online admission application and store it as a pending Admission.
+    Expects JSON or form data from the public site.
+    Maps fields from the public form to the Admission model.
+    """
+    try:
+        data = request.get_json(silent=True) or request.form or {}
+
+        name = (data.get('studentName') or data.get('name') or '').strip()
+        class_name = (data.get('class') or data.get('class_name') or '').strip() or None
+        section = (data.get('section') or '').strip() or None
+        phone = (data.get('fatherPhone') or data.get('phone') or '').strip() or None
+        email = (data.get('email') or '').strip() or None
+        address = (data.get('address') or '').strip() or None
+        status_in = (data.get('status') or '').strip().lower()
+        status_val = 'pending'
+        if status_in in ('pending','confirmed','rejected'):
+            status_val = status_in
+
+        # Generate password for online admissions when phone is present
+        gen_password = _gen_admission_password(name, phone) if phone else None
+
+        if not name:
+            return jsonify({"success": False, "error": "studentName (name) is required"}), 400
+
+        adm = Admission(
+            name=name,
+            class_name=class_name,
+            section=section,
+            phone=phone,
+            email=email,
+            address=address,
+            status=status_val,
+            password=gen_password,
+        )
+        db.session.add(adm)
+        db.session.commit()
+
+        return jsonify({"success": True, "admission_id": adm.id})
+    except Exception as e:
+        # Don't expose internals; log in real apps
+        try:
+            db.session.rollback()
+        except Exception:
+            pass
+        return jsonify({"success": False, "error": "failed to save application"}), 500
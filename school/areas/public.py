@@ -0,0 +1,18 @@
+"""Public area: the landing page and the assets under /static."""
+from flask import current_app, send_from_directory
+
+from app import AreaBlueprint, STATIC_DIR
+
+bp = AreaBlueprint('public', __name__)
+
+
+@bp.route('/')
+def home():
+    # Serve your existing landing page in public/index.html
+    return send_from_directory(current_app.static_folder, 'index.html')
+
+
+# Explicit static route to serve assets from the public/ directory
+@bp.route('/static/<path:filename>')
+def static_files(filename):
+    return send_from_directory(STATIC_DIR, filename)
@@ -0,0 +1,127 @@
+"""Student area: login, dashboard and logout."""
+from flask import flash, redirect, render_template, request, session, url_for
+from datetime import datetime
+
+from app import (
+    Admission, AreaBlueprint, Attendance, db, ensure_identity, login_required, LoginAudit, Result, Student,
+    student_fee_summary, term_label, User,
+)
+
+bp = AreaBlueprint('student', __name__)
+
+
+@bp.route('/student/login', methods=['GET', 'POST'])
+def student_login():
+    if request.method == 'POST':
+        roll_no = request.form.get('roll_no', '').strip()
+        password = request.form.get('password', '')
+
+        # 1) Try Admission-based authentication first (roll_no + Admission.password)
+        adm = Admission.query.filter_by(roll_no=roll_no).first()
+        if adm and adm.status == 'confirmed' and (adm.password or '') and password == adm.password:
+            # Ensure Student and unified User exist (created together; committed with the audit row)
+            student, u = ensure_identity(
+                'student', roll_no, name=adm.name or roll_no, password=adm.password,
+                class_name=adm.class_name, section=adm.section, phone=adm.phone,
+                email=adm.email, address=adm.address,
+            )
+
+            session.permanent = True
+            session['student_id'] = student.id
+            # Audit success
+            LoginAudit.query.filter_by(user_type='student', username=roll_no).delete()
+            db.session.add(LoginAudit(
+                user_type='student', username=roll_no, user_id=u.id if u else None,
+                success=True, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+            ))
+            db.session.commit()
+            return redirect(url_for('student_dashboard'))
+
+        # If admission exists but not confirmed, block login with a clear message
+        if adm and adm.status != 'confirmed':
+            LoginAudit.query.filter_by(user_type='student', username=roll_no).delete()
+            db.session.add(LoginAudit(
+                user_type='student', username=roll_no, user_id=None,
+                success=False, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+            ))
+            db.session.commit()
+            flash('Your admission is not confirmed yet. Please contact the school.', 'warning')
+            return redirect(url_for('student_login'))
+
+        # 2) Fallback: legacy authentication against unified users table
+        u = User.query.filter_by(role='student', username=roll_no).first()
+        if u and u.check_password(password):
+            student, _ = ensure_identity('student', roll_no, name=u.name or roll_no, user=u)
+
+            session.permanent = True
+            session['student_id'] = student.id
+            LoginAudit.query.filter_by(user_type='student', username=roll_no).delete()
+            db.session.add(LoginAudit(
+                user_type='student', username=roll_no, user_id=u.id,
+                success=True, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+            ))
+            db.session.commit()
+            return redirect(url_for('student_dashboard'))
+
+        # If both methods fail, record failure and show message
+        LoginAudit.query.filter_by(user_type='student', username=roll_no).delete()
+        db.session.add(LoginAudit(
+            user_type='student', username=roll_no, user_id=u.id if 'u' in locals() and u else None,
+            success=False, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+        ))
+        db.session.commit()
+        flash('Invalid roll number or password', 'danger')
+        return redirect(url_for('student_login'))
+
+    return render_template('student_login.html')
+
+
+@bp.route('/student/dashboard')
+@login_required
+def student_dashboard():
+    # Get the logged-in student
+    sid = session.get('student_id')
+    student = Student.query.get(sid)
+    if not student:
+        session.clear()
+        flash('Session expired. Please login again.', 'warning')
+        return redirect(url_for('student_login'))
+
+    # Attendance percentage
+    total_att = Attendance.query.filter_by(student_id=student.id).count()
+    present_att = Attendance.query.filter_by(student_id=student.id, status='Present').count()
+    attendance_pct = round((present_att / total_att) * 100, 1) if total_att else 0
+
+    # Last score (most recent result)
+    last_res = Result.query.filter_by(student_id=student.id).order_by(Result.id.desc()).first()
+    if last_res and last_res.max_marks:
+        last_score = f"{round((last_res.marks_obtained / last_res.max_marks) * 100)}%"
+    elif last_res:
+        last_score = str(int(last_res.marks_obtained))
+    else:
+        last_score = "-"
+
+    # Fees paid and still due, from the maintained balance row
+    fees = student_fee_summary(student.id)
+    # Show as integer if whole number, else 2 decimals
+    total_fees_paid = int(fees['paid']) if float(fees['paid']).is_integer() else round(float(fees['paid']), 2)
+    fees_due = max(fees['balance'], 0)
+    fees_due = int(fees_due) if float(fees_due).is_integer() else round(float(fees_due), 2)
+
+    return render_template(
+        'student_dashboard.html',
+        student=student,
+        attendance_pct=attendance_pct,
+        last_score=last_score,
+        total_fees_paid=total_fees_paid,
+        fees_due=fees_due,
+        term_label=term_label(datetime.utcnow()),
+    )
+
+
+@bp.route('/student/logout')
+@login_required
+def student_logout():
+    session.clear()
+    flash('Logged out successfully', 'info')
+    return redirect(url_for('student_login'))
@@ -0,0 +1,880 @@
+"""Teacher area: login, dashboard, attendance and marks entry, and subject enrollment."""
+from flask import current_app, flash, jsonify, redirect, render_template, request, session, url_for
+from sqlalchemy.exc import IntegrityError
+import sqlalchemy as sa
+from datetime import datetime, timedelta
+
+from app import (
+    _gen_admission_password, AreaBlueprint, Assessment, assessment_components, Attendance, audit_changes,
+    catalog_classes, catalog_sections, class_roster, class_term_scores, create_identity, db, delete_returning,
+    enqueue_job, enroll_students, enrollment_map, ensure_identity, FeePayment, Job, job_as_dict, LoginAudit,
+    queue_absence_notifications, replica_reads, Result, roster_filter, save_assessment_grid,
+    schedule_notification_dispatch, set_assessment_weights, set_identity_password, sports_medal_tally,
+    SPORTS_TALLY_DIMENSIONS, sports_top_students, SportsActivity, Student, Subject, subject_list, Teacher,
+    teacher_required, term_label, unenroll_students, update_identity, User, username_taken,
+)
+
+bp = AreaBlueprint('teacher', __name__)
+
+
+@bp.route('/teacher/assessments')
+@teacher_required
+@replica_reads
+def teacher_assessments():
+    t = Teacher.query.get(session.get('teacher_id'))
+    class_list = catalog_classes()
+    section_list = catalog_sections()
+    subjects = subject_list()
+    now = datetime.utcnow()
+    current_term = term_label(now)
+    terms = [tm for (tm,) in db.session.query(Assessment.term).filter(Assessment.term.isnot(None))
+             .distinct().order_by(Assessment.term.desc())]
+    if current_term not in terms:
+        terms.insert(0, current_term)
+
+    cls = (request.args.get('class') or '').strip() or None
+    sec = (request.args.get('section') or '').strip() or None
+    term = (request.args.get('term') or '').strip() or current_term
+    subject_id = request.args.get('subject', type=int) or (subjects[0].id if subjects else None)
+
+    students = class_roster(cls, sec)
+    components = assessment_components(subject_id)
+
+    # Existing scores for the grid (latest row wins when a component was entered twice)
+    existing = {}
+    if students and subject_id:
+        rows = db.session.query(Assessment.student_id, Assessment.component, Assessment.score).filter(
+            Assessment.subject_id == subject_id, Assessment.term == term,
+            Assessment.student_id.in_([s.id for s in students])).order_by(Assessment.id)
+        for sid, component, score in rows:
+            existing[(sid, component)] = score
+    scores = class_term_scores(cls, sec, term)
+
+    return render_template('teacher_assessments.html', teacher=t, class_list=class_list, section_list=section_list,
+                           subjects=subjects, terms=terms, selected_class=cls, selected_section=sec, term=term,
+                           subject_id=subject_id, students=students, components=components,
+                           existing=existing, scores=scores)
+
+
+@bp.route('/teacher/assessments/bulk', methods=['POST'])
+@teacher_required
+def teacher_assessments_bulk():
+    cls = (request.form.get('class_name') or '').strip()
+    sec = (request.form.get('section') or '').strip()
+    term = (request.form.get('term') or '').strip()
+    subject_id = request.form.get('subject_id', type=int)
+    back = url_for('teacher_assessments', **{'class': cls, 'section': sec, 'term': term, 'subject': subject_id or ''})
+    if not subject_id or not term:
+        flash('Choose a subject and term first', 'warning')
+        return redirect(back)
+
+    # Column headers: component names with the max score used for this entry
+    columns = []
+    for idx in range(1, 21):
+        name = (request.form.get(f'component_{idx}') or '').strip()
+        if not name:
+            continue
+        try:
+            max_score = float(request.form.get(f'max_{idx}') or 0)
+        except ValueError:
+            max_score = 0
+        if max_score <= 0:
+            flash(f'Max score for {name} must be positive', 'danger')
+            return redirect(back)
+        columns.append((idx, name, max_score))
+
+    cells = {}
+    for sid in request.form.getlist('student_id'):
+        for idx, name, max_score in columns:
+            raw = (request.form.get(f'score_{sid}_{idx}') or '').strip()
+            if raw == '':
+                continue  # blank cells keep what is stored
+            try:
+                score = float(raw)
+            except ValueError:
+                flash(f'Invalid score "{raw}"', 'danger')
+                return redirect(back)
+            if not 0 <= score <= max_score:
+                flash(f'Scores for {name} must be between 0 and {max_score:g}', 'danger')
+                return redirect(back)
+            cells[(int(sid), name)] = score
+    saved = save_assessment_grid(subject_id, term, cells, {name: m for _, name, m in columns},
+                                 on_date=datetime.utcnow().date())
+    db.session.commit()
+    flash(f'Saved {saved} assessment scores', 'success')
+    return redirect(back)
+
+
+@bp.route('/teacher/assessments/weights', methods=['POST'])
+@teacher_required
+def teacher_assessment_weights():
+    subject_id = request.form.get('subject_id', type=int) if request.form.get('scope') != 'default' else None
+    components = {}
+    try:
+        for idx in range(1, 21):
+            name = (request.form.get(f'w_component_{idx}') or '').strip()
+            if not name:
+                continue
+            weight = float(request.form.get(f'w_weight_{idx}') or 0)
+            max_score = float(request.form.get(f'w_max_{idx}') or 0)
+            if weight < 0 or max_score <= 0:
+                raise ValueError(name)
+            components[name] = (weight, max_score)
+    except ValueError:
+        flash('Weights must be zero or more and max scores positive', 'danger')
+    else:
+        set_assessment_weights(subject_id, components)
+        db.session.commit()
+        flash('Component weights saved' + (' as the school default' if subject_id is None else ''), 'success')
+    return redirect(url_for('teacher_assessments', **{'class': request.form.get('class_name') or '',
+                                                      'section': request.form.get('section') or '',
+                                                      'term': request.form.get('term') or '',
+                                                      'subject': request.form.get('subject_id') or ''}))
+
+
+@bp.route('/teacher/assessment/<int:assessment_id>/edit', methods=['GET', 'POST'])
+@teacher_required
+def teacher_edit_assessment(assessment_id):
+    assessment = Assessment.query.get(assessment_id)
+    if not assessment:
+        flash('Assessment not found', 'danger')
+        return redirect(url_for('teacher_assessments'))
+
+    if request.method == 'POST':
+        try:
+            score = float((request.form.get('score') or '').strip())
+            max_score = float((request.form.get('max_score') or '').strip())
+            if max_score <= 0 or not 0 <= score <= max_score:
+                raise ValueError
+        except ValueError:
+            flash('Score must be between 0 and a positive max score', 'danger')
+            return redirect(url_for('teacher_edit_assessment', assessment_id=assessment_id))
+        assessment.score = score
+        assessment.max_score = max_score
+
+        try:
+            db.session.commit()
+            flash('Assessment updated successfully', 'success')
+        except Exception:
+            db.session.rollback()
+            flash('Failed to update assessment', 'danger')
+        student = Student.query.get(assessment.student_id)
+        return redirect(url_for('teacher_assessments', **{'class': (student.class_name if student else '') or '',
+                                                          'term': assessment.term or '',
+                                                          'subject': assessment.subject_id}))
+    return render_template('teacher_edit_assessment.html', assessment=assessment,
+                           student=Student.query.get(assessment.student_id),
+                           subject=Subject.query.get(assessment.subject_id))
+
+@bp.route('/teacher/attendance/summary')
+@teacher_required
+def teacher_attendance_summary():
+    attendance_summary = db.session.query(Attendance.student_id, db.func.count(Attendance.id), db.func.sum(db.case([(Attendance.status == 'Present', 1)], else_=0))).group_by(Attendance.student_id).all()
+    return render_template('teacher_attendance_summary.html', attendance_summary=attendance_summary)
+
+
+@bp.route('/teacher/login', methods=['GET', 'POST'])
+def teacher_login():
+    if request.method == 'POST':
+        username = request.form.get('username', '').strip()
+        password = request.form.get('password', '')
+        u = User.query.filter_by(role='teacher', username=username).first()
+        if not u or not u.check_password(password):
+            # Keep only the latest audit entry per user
+            LoginAudit.query.filter_by(user_type='teacher', username=username).delete()
+            db.session.add(LoginAudit(
+                user_type='teacher', username=username, user_id=u.id if u else None,
+                success=False, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+            ))
+            db.session.commit()
+            flash('Invalid username or password', 'danger')
+            return redirect(url_for('teacher_login'))
+
+        # Map to existing Teacher record for dashboard compatibility
+        t, _ = ensure_identity('teacher', username, name=u.name or username, email=u.email, user=u)
+
+        session['teacher_id'] = t.id
+        session.permanent = True
+        # Keep only the latest audit entry per user
+        LoginAudit.query.filter_by(user_type='teacher', username=username).delete()
+        db.session.add(LoginAudit(
+            user_type='teacher', username=username, user_id=u.id,
+            success=True, ip_address=request.remote_addr, user_agent=request.headers.get('User-Agent')
+        ))
+        db.session.commit()
+        return redirect(url_for('teacher_dashboard'))
+    return render_template('teacher_login.html')
+
+
+@bp.route('/teacher/profile', methods=['GET', 'POST'])
+@teacher_required
+def teacher_update_profile():
+    # View and update the logged-in teacher's profile
+    t = Teacher.query.get(session.get('teacher_id'))
+    if not t:
+        flash('Session expired. Please login again.', 'warning')
+        return redirect(url_for('teacher_login'))
+    u = User.query.filter_by(role='teacher', username=t.username).first()
+
+    if request.method == 'GET':
+        return render_template('teacher_profile.html', teacher=t, user=u)
+
+    # POST: update fields
+    name = (request.form.get('name') or '').strip() or t.name
+    email = (request.form.get('email') or '').strip() or None
+    phone = (request.form.get('phone') or '').strip() or None
+
+    update_identity(t, u, name=name, email=email, phone=phone)
+
+    # Optional password change
+    new_password = (request.form.get('new_password') or '').strip()
+    confirm_password = (request.form.get('confirm_password') or '').strip()
+    if new_password:
+        if new_password != confirm_password:
+            db.session.rollback()
+            flash('New password and confirm password do not match.', 'danger')
+            return redirect(url_for('teacher_update_profile'))
+        # Set password on both User and Teacher (hash kept in sync)
+        set_identity_password(t, u, new_password)
+
+    try:
+        db.session.commit()
+        flash('Profile updated successfully.', 'success')
+    except Exception:
+        db.session.rollback()
+        flash('Failed to update profile.', 'danger')
+    return redirect(url_for('teacher_update_profile'))
+
+
+@bp.route('/teacher/students/new', methods=['POST'])
+@teacher_required
+def teacher_create_student():
+    # Allow teachers to add a new student with minimal details
+    roll_no = (request.form.get('roll_no') or '').strip()
+    name = (request.form.get('name') or '').strip()
+    class_name = (request.form.get('class_name') or '').strip() or None
+    section = (request.form.get('section') or '').strip() or None
+    phone = (request.form.get('phone') or '').strip() or None
+    email = (request.form.get('email') or '').strip() or None
+    address = (request.form.get('address') or '').strip() or None
+
+    if not roll_no or not name:
+        flash('Roll No and Name are required to create a student.', 'danger')
+        return redirect(url_for('teacher_dashboard'))
+
+    # Prevent duplicates across Student and User
+    if username_taken('student', roll_no):
+        flash('A student with this Roll No already exists.', 'danger')
+        return redirect(url_for('teacher_dashboard'))
+
+    # Generate initial password similar to admissions pattern
+    gen_password = _gen_admission_password(name, phone or roll_no)
+
+    # Create Student and unified User together
+    try:
+        create_identity('student', roll_no, name, gen_password, class_name=class_name, section=section,
+                        phone=phone, email=email, address=address)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        flash('A student with this Roll No already exists.', 'danger')
+        return redirect(url_for('teacher_dashboard'))
+
+    flash(f'Student created. Initial password: {gen_password}', 'success')
+    return redirect(url_for('teacher_dashboard'))
+
+
+@bp.route('/teacher/logout')
+@teacher_required
+def teacher_logout():
+    session.pop('teacher_id', None)
+    flash('Logged out', 'info')
+    return redirect(url_for('teacher_login'))
+
+
+@bp.route('/teacher/workspace')
+@teacher_required
+@replica_reads
+def teacher_workspace():
+    mode = (request.args.get('mode') or 'attendance').lower()  # attendance|results|sports
+    class_name = (request.args.get('class') or '').strip()
+    section = (request.args.get('section') or '').strip()
+    subject_id = (request.args.get('subject_id') or '').strip()
+    term = (request.args.get('term') or '').strip()
+    date_str = (request.args.get('date') or '').strip()
+
+    students = class_roster(class_name, section)
+    subjects = subject_list()
+
+    return render_template('teacher_workspace.html',
+                           mode=mode, students=students, subjects=subjects,
+                           class_name=class_name, section=section, subject_id=subject_id,
+                           term=term, date_str=date_str)
+
+
+@bp.route('/teacher/workspace/attendance/bulk', methods=['POST'])
+@teacher_required
+def teacher_workspace_attendance_bulk():
+    student_ids = request.form.getlist('student_id')
+    statuses = request.form.getlist('status')
+    subject_id = request.form.get('subject_id') or None
+    date_str = request.form.get('date') or ''
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else datetime.utcnow().date()
+
+    absent = []
+    for idx, sid in enumerate(student_ids):
+        status = (statuses[idx] if idx < len(statuses) else 'Present') or 'Present'
+        rec = Attendance(student_id=int(sid), status=status, subject_id=int(subject_id) if subject_id else None,
+                         date=date_val, marked_by_teacher_id=session['teacher_id'])
+        db.session.add(rec)
+        if status == 'Absent':
+            absent.append((int(sid), date_val))
+    queued = queue_absence_notifications(absent) if not subject_id else 0
+    db.session.commit()
+    if queued:
+        schedule_notification_dispatch()
+    flash('Attendance saved for class', 'success')
+    return redirect(url_for('teacher_workspace', mode='attendance', **{
+        'class': request.form.get('class_name') or '', 'section': request.form.get('section') or ''
+    }))
+
+
+@bp.route('/teacher/workspace/results/bulk', methods=['POST'])
+@teacher_required
+def teacher_workspace_results_bulk():
+    student_ids = request.form.getlist('student_id')
+    scores = request.form.getlist('score')
+    max_scores = request.form.getlist('max_score')
+    subject_id = request.form.get('subject_id')
+    term = request.form.get('term')
+    date_str = request.form.get('date') or ''
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else None
+
+    for idx, sid in enumerate(student_ids):
+        try:
+            score_v = float(scores[idx]) if idx < len(scores) and scores[idx] else None
+            max_v = float(max_scores[idx]) if idx < len(max_scores) and max_scores[idx] else None
+        except ValueError:
+            score_v, max_v = None, None
+        if score_v is None or max_v is None:
+            continue
+        rec = Result(student_id=int(sid), subject_id=int(subject_id), term=term,
+                     marks_obtained=score_v, max_marks=max_v, graded_by_teacher_id=session['teacher_id'])
+        db.session.add(rec)
+    db.session.commit()
+    flash('Results saved for class', 'success')
+    return redirect(url_for('teacher_workspace', mode='results', **{
+        'class': request.form.get('class_name') or '', 'section': request.form.get('section') or ''
+    }))
+
+
+@bp.route('/teacher/workspace/sports/bulk', methods=['POST'])
+@teacher_required
+def teacher_workspace_sports_bulk():
+    student_ids = request.form.getlist('student_id')
+    activities = request.form.getlist('activity')
+    levels = request.form.getlist('level')
+    results_f = request.form.getlist('result')
+    date_str = request.form.get('date') or ''
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else None
+    notes_list = request.form.getlist('notes')
+
+    for idx, sid in enumerate(student_ids):
+        act = (activities[idx] if idx < len(activities) else '').strip()
+        if not act:
+            continue
+        lvl = (levels[idx] if idx < len(levels) else '').strip() or None
+        res = (results_f[idx] if idx < len(results_f) else '').strip() or None
+        nts = (notes_list[idx] if idx < len(notes_list) else '').strip() or None
+        rec = SportsActivity(student_id=int(sid), activity=act, level=lvl, result=res, date=date_val,
+                             notes=nts, recorded_by_teacher_id=session['teacher_id'])
+        db.session.add(rec)
+    db.session.commit()
+    flash('Sports activities saved for class', 'success')
+    return redirect(url_for('teacher_workspace', mode='sports', **{
+        'class': request.form.get('class_name') or '', 'section': request.form.get('section') or ''
+    }))
+@bp.route('/teacher/dashboard')
+@teacher_required
+def teacher_dashboard():
+    teacher = Teacher.query.get(session['teacher_id'])
+    students = class_roster()
+    subjects = subject_list()
+    return render_template('teacher_dashboard.html', teacher=teacher, students=students, subjects=subjects,
+                           section_list=catalog_sections())
+
+
+# ---- Teacher data submission endpoints ----
+@bp.route('/teacher/attendance', methods=['POST'])
+@teacher_required
+def submit_attendance():
+    student_id = request.form.get('student_id')
+    status = request.form.get('status')  # Present/Absent
+    subject_id = request.form.get('subject_id') or None
+    date_str = request.form.get('date')
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else datetime.utcnow().date()
+    rec = Attendance(student_id=student_id, status=status, subject_id=subject_id, date=date_val, marked_by_teacher_id=session['teacher_id'])
+    db.session.add(rec)
+    queued = queue_absence_notifications([(int(student_id), date_val)]) if status == 'Absent' and not subject_id else 0
+    db.session.commit()
+    if queued:
+        schedule_notification_dispatch()
+    flash('Attendance saved', 'success')
+    return redirect(url_for('teacher_dashboard'))
+
+
+@bp.route('/teacher/result', methods=['POST'])
+@teacher_required
+def submit_result():
+    student_id = request.form.get('student_id')
+    subject_id = request.form.get('subject_id')
+    term = request.form.get('term')
+    marks_obtained = float(request.form.get('marks_obtained') or 0)
+    max_marks = float(request.form.get('max_marks') or 100)
+    rec = Result(student_id=student_id, subject_id=subject_id, term=term, marks_obtained=marks_obtained, max_marks=max_marks, graded_by_teacher_id=session['teacher_id'])
+    db.session.add(rec)
+    db.session.commit()
+    flash('Result saved', 'success')
+    return redirect(url_for('teacher_dashboard'))
+
+
+@bp.route('/teacher/fee', methods=['POST'])
+@teacher_required
+def submit_fee():
+    student_id = request.form.get('student_id')
+    amount = float(request.form.get('amount') or 0)
+    mode = request.form.get('mode')
+    reference_no = request.form.get('reference_no')
+    description = request.form.get('description')
+    rec = FeePayment(student_id=student_id, amount=amount, mode=mode, reference_no=reference_no, description=description, recorded_by_teacher_id=session['teacher_id'])
+    db.session.add(rec)
+    db.session.commit()
+    flash('Fee payment recorded', 'success')
+    return redirect(url_for('teacher_dashboard'))
+
+
+# -------- Teacher workspace pages (GET) and bulk actions (POST) --------
+@bp.route('/teacher/attendance/sheet')
+@teacher_required
+@replica_reads
+def teacher_attendance_sheet():
+    t = Teacher.query.get(session.get('teacher_id'))
+    class_list = catalog_classes()
+
+    cls = (request.args.get('class') or '').strip() or None
+    sec = (request.args.get('section') or '').strip() or None
+    subject = Subject.query.get(request.args.get('subject', type=int)) if request.args.get('subject') else None
+    subject_id = subject.id if subject else None
+    date_str = (request.args.get('date') or '').strip()
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else datetime.utcnow().date()
+
+    # Build all days in the selected month
+    first_day = date_val.replace(day=1)
+    if first_day.month == 12:
+        next_month = first_day.replace(year=first_day.year + 1, month=1)
+    else:
+        next_month = first_day.replace(month=first_day.month + 1)
+    total_days = (next_month - first_day).days
+    date_list = [first_day + timedelta(days=i) for i in range(total_days)]
+
+    students = class_roster(cls, sec)
+    if subject_id:
+        # Subject attendance: only students enrolled in the subject
+        enrolled = enrollment_map(cls, sec)
+        students = [s for s in students if subject_id in enrolled.get(s.id, ())]
+    # Preload existing attendance for this class/section and month to pre-fill checkboxes
+    student_ids = [s.id for s in students]
+    present_keys, recorded_keys = set(), set()
+    if student_ids:
+        existing = db.session.query(Attendance.student_id, Attendance.date, Attendance.status).filter(
+            Attendance.student_id.in_(student_ids),
+            _attendance_subject_clause(subject_id),
+            Attendance.date >= first_day,
+            Attendance.date < next_month
+        ).all()
+        for sid, d, status in existing:
+            key = f"{sid}_{d.isoformat()}"
+            recorded_keys.add(key)
+            if (status or '').lower().startswith('present'):
+                present_keys.add(key)
+
+    version = _attendance_version(cls, sec, first_day, next_month, subject_id)
+    return render_template('teacher_attendance.html', teacher=t, class_list=class_list,
+                           selected_class=cls, selected_section=sec, subject=subject, date_val=date_val,
+                           date_list=date_list, students=students, present_keys=present_keys,
+                           recorded_keys=recorded_keys, version=version)
+
+
+def _attendance_subject_clause(subject_id):
+    """Daily attendance has no subject; subject sheets only see their own rows."""
+    return Attendance.subject_id.is_(None) if subject_id is None else Attendance.subject_id == subject_id
+
+
+def _attendance_version(cls, sec, first_day, next_month, subject_id=None) -> str:
+    """Token that changes whenever attendance for this class and section, subject and month is saved.
+
+    Saves replace rows, so the row count plus the highest id moves on every save.
+    """
+    q = db.session.query(db.func.count(Attendance.id), db.func.max(Attendance.id)).filter(
+        Attendance.date >= first_day, Attendance.date < next_month, _attendance_subject_clause(subject_id))
+    roster = roster_filter(cls, sec)
+    if roster is not None:
+        q = q.join(Student, Student.id == Attendance.student_id).filter(roster)
+    count, max_id = q.one()
+    return f"{count}-{max_id or 0}"
+
+
+def _save_attendance_cells(cells: dict, teacher_id, subject_id=None) -> int:
+    """Replace attendance for {(student_id, date): 'Present'|'Absent'} in the current transaction."""
+    att = Attendance.__table__
+    by_date = {}
+    for sid, d in cells:
+        by_date.setdefault(d, []).append(sid)
+    old = {}
+    for d, sids in by_date.items():
+        for row in delete_returning(att, sa.and_(att.c.date == d, att.c.student_id.in_(sids),
+                                                 _attendance_subject_clause(subject_id)),
+                                    (att.c.id, att.c.student_id, att.c.date, att.c.status)):
+            old[(row.student_id, row.date)] = row
+    # Audit cells whose status changed (the rows are replaced, so row_id is the old row's)
+    audit_changes(
+        ('attendance', old[key].id if key in old else None, key[0], 'update' if key in old else 'insert',
+         {'status': old[key].status} if key in old else None,
+         {'status': status} if key in old else {'date': key[1], 'status': status, 'subject_id': subject_id})
+        for key, status in cells.items() if key not in old or old[key].status != status)
+    if cells:
+        db.session.execute(sa.insert(Attendance.__table__), [
+            {'student_id': sid, 'subject_id': subject_id, 'date': d, 'status': status, 'marked_by_teacher_id': teacher_id}
+            for (sid, d), status in cells.items()
+        ])
+    return len(cells)
+
+
+@bp.route('/teacher/attendance/bulk', methods=['POST'])
+@teacher_required
+def teacher_attendance_bulk():
+    cls = (request.form.get('class_name') or '').strip() or None
+    sec = (request.form.get('section') or '').strip() or None
+    base_date_str = (request.form.get('date') or '').strip()
+    base_date = datetime.strptime(base_date_str, '%Y-%m-%d').date() if base_date_str else datetime.utcnow().date()
+    # Build the month dates from base_date
+    first_day = base_date.replace(day=1)
+    if first_day.month == 12:
+        next_month = first_day.replace(year=first_day.year + 1, month=1)
+    else:
+        next_month = first_day.replace(month=first_day.month + 1)
+    total_days = (next_month - first_day).days
+    date_list = [first_day + timedelta(days=i) for i in range(total_days)]
+
+    subject_id = request.form.get('subject_id', type=int)
+    ids = request.form.getlist('student_id')
+    cells = {}
+    for sid in ids:
+        sid_int = int(sid)
+        for d in date_list:
+            key = f'status_{sid_int}_{d.isoformat()}'
+            # Checkbox behavior: present only when checked; missing implies Absent
+            cells[(sid_int, d)] = 'Present' if (request.form.get(key) or '').strip() else 'Absent'
+    _save_attendance_cells(cells, session.get('teacher_id'), subject_id)
+    queued = queue_absence_notifications(k for k, v in cells.items() if v == 'Absent') if subject_id is None else 0
+    db.session.commit()
+    if queued:
+        schedule_notification_dispatch()
+    flash('Monthly attendance saved.', 'success')
+    return redirect(url_for('teacher_attendance_sheet', **({'class': cls} if cls else {}),
+                            **({'section': sec} if sec else {}), **({'subject': subject_id} if subject_id else {}),
+                            date=base_date.isoformat()))
+
+
+@bp.route('/teacher/attendance/delta', methods=['POST'])
+@teacher_required
+def teacher_attendance_delta():
+    """Save only the attendance cells that changed on the sheet (JSON).
+
+    Body: {"class_name", "section" and "subject_id" (optional), "date" (any day of the sheet month),
+    "version" (from the sheet),
+    "rows": {"<student_id>": "PA-P..."} with one char per day of the month
+    (P present, A absent, - unchanged), and "cells": [[student_id, "YYYY-MM-DD", 1|0], ...]
+    for days outside the month grid (edited column headers).}
+    Replies 409 with the current version when someone saved the sheet in between.
+    """
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({'error': 'body must be a JSON object'}), 400
+    rows = payload.get('rows') or {}
+    if not isinstance(rows, dict):
+        return jsonify({'error': 'rows must be an object of student_id: day string'}), 400
+    cls = (payload.get('class_name') or '').strip() or None
+    sec = (payload.get('section') or '').strip() or None
+    try:
+        subject_id = int(payload['subject_id']) if payload.get('subject_id') else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'subject_id must be an integer'}), 400
+    try:
+        base_date = datetime.strptime((payload.get('date') or '').strip(), '%Y-%m-%d').date()
+    except ValueError:
+        return jsonify({'error': 'date must be YYYY-MM-DD'}), 400
+    first_day = base_date.replace(day=1)
+    next_month = (first_day + timedelta(days=32)).replace(day=1)
+    total_days = (next_month - first_day).days
+
+    current = _attendance_version(cls, sec, first_day, next_month, subject_id)
+    if payload.get('version') != current:
+        return jsonify({'error': 'conflict', 'version': current}), 409
+
+    cells = {}
+    try:
+        for sid, bits in rows.items():
+            if len(bits) > total_days:
+                return jsonify({'error': f'row for student {sid} is longer than the month'}), 400
+            for i, ch in enumerate(bits):
+                if ch in 'PA':
+                    cells[(int(sid), first_day + timedelta(days=i))] = 'Present' if ch == 'P' else 'Absent'
+        for sid, day, present in payload.get('cells') or []:
+            cells[(int(sid), datetime.strptime(day, '%Y-%m-%d').date())] = 'Present' if present else 'Absent'
+    except (TypeError, ValueError):
+        return jsonify({'error': 'malformed rows or cells'}), 400
+
+    # Ignore ids that are not students of this sheet's class and section (stale sheet after a deletion or move)
+    known = set()
+    if cells:
+        q = db.session.query(Student.id).filter(Student.id.in_({sid for sid, _ in cells}))
+        roster = roster_filter(cls, sec)
+        known = {sid for (sid,) in (q if roster is None else q.filter(roster))}
+    cells = {key: status for key, status in cells.items() if key[0] in known}
+    saved = _save_attendance_cells(cells, session.get('teacher_id'), subject_id)
+    queued = queue_absence_notifications(k for k, v in cells.items() if v == 'Absent') if subject_id is None else 0
+    db.session.commit()
+    if queued:
+        schedule_notification_dispatch()
+    return jsonify({'ok': True, 'saved': saved,
+                    'version': _attendance_version(cls, sec, first_day, next_month, subject_id)})
+
+
+@bp.route('/teacher/results/upload')
+@teacher_required
+@replica_reads
+def teacher_results_upload():
+    t = Teacher.query.get(session.get('teacher_id'))
+    # Filters: class and section
+    class_list = catalog_classes()
+    section_list = catalog_sections()
+    cls = (request.args.get('class') or '').strip() or None
+    sec = (request.args.get('section') or '').strip() or None
+
+    students = class_roster(cls, sec)
+
+    # Six subject columns (editable on page): the subjects this roster is enrolled in,
+    # most common first, else the first six subjects in the school
+    subject_names = dict(db.session.query(Subject.id, Subject.name))
+    enrolled = enrollment_map(cls, sec)
+    enrolled_names, popularity = {}, {}
+    for s in students:
+        for subject_id in enrolled.get(s.id, ()):
+            name = subject_names.get(subject_id)
+            if name:
+                enrolled_names.setdefault(s.id, set()).add(name)
+                popularity[name] = popularity.get(name, 0) + 1
+    if popularity:
+        names = sorted(popularity, key=lambda n: (-popularity[n], n))[:6]
+    else:
+        names = list(dict.fromkeys(n for n in sorted(subject_names.values()) if n))[:6]
+    default_subjects = names + [''] * (6 - len(names))
+
+    return render_template('teacher_results.html', teacher=t, class_list=class_list,
+                           selected_class=cls, term='', students=students,
+                           subjects_six=default_subjects, section_list=section_list, selected_section=sec,
+                           enrolled_names=enrolled_names)
+
+
+# -------- Subject enrollment --------
+@bp.route('/teacher/enrollments', methods=['GET', 'POST'])
+@teacher_required
+def teacher_enrollments():
+    """Subject enrollment API (JSON).
+
+    GET ?class=&section= returns {"students": {student_id: [subject_id, ...]}, "subjects": {id: name}}.
+    POST {"subjects": [id or name, ...], "class_name", "section", "student_ids": [...],
+    "action": "enroll" (default) | "unenroll"} needs at least one of class_name, section or student_ids.
+    With "async": true the change runs as a background job and the reply (202) carries its status URL.
+    """
+    if request.method == 'GET':
+        cls = (request.args.get('class') or '').strip() or None
+        sec = (request.args.get('section') or '').strip() or None
+        subjects = {sid: name for sid, name in db.session.query(Subject.id, Subject.name).order_by(Subject.name)}
+        return jsonify({'class': cls, 'section': sec, 'students': enrollment_map(cls, sec), 'subjects': subjects})
+
+    payload = request.get_json(silent=True) or {}
+    action = (payload.get('action') or 'enroll').strip().lower()
+    if action not in ('enroll', 'unenroll'):
+        return jsonify({'error': 'action must be enroll or unenroll'}), 400
+    cls = (payload.get('class_name') or '').strip() or None
+    sec = (payload.get('section') or '').strip() or None
+    try:
+        student_ids = [int(x) for x in payload['student_ids']] if payload.get('student_ids') is not None else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'student_ids must be a list of integers'}), 400
+    if not cls and not sec and not student_ids:
+        return jsonify({'error': 'class_name, section or student_ids is required'}), 400
+
+    wanted = payload.get('subjects') or []
+    if not isinstance(wanted, list) or not wanted:
+        return jsonify({'error': 'subjects must be a non-empty list of subject ids or names'}), 400
+    by_name = {name: sid for sid, name in db.session.query(Subject.id, Subject.name)}
+    known_ids = set(by_name.values())
+    subject_ids, unknown = set(), []
+    for item in wanted:
+        sid = item if isinstance(item, int) else by_name.get(str(item).strip())
+        if sid in known_ids:
+            subject_ids.add(sid)
+        else:
+            unknown.append(item)
+    if unknown:
+        return jsonify({'error': 'unknown subjects', 'subjects': unknown}), 400
+
+    if payload.get('async'):
+        job = enqueue_job('enrollment.apply', {'action': action, 'subject_ids': sorted(subject_ids), 'class_name': cls,
+                                               'section': sec, 'student_ids': student_ids},
+                          created_by=f"teacher:{session.get('teacher_id')}")
+        return jsonify({'ok': True, 'job_id': job.id, 'status': job.status,
+                        'status_url': url_for('teacher_job_status', job_id=job.id)}), 202
+    apply = enroll_students if action == 'enroll' else unenroll_students
+    changed = apply(subject_ids, class_name=cls, section=sec, student_ids=student_ids)
+    db.session.commit()
+    return jsonify({'ok': True, 'action': action, 'subjects': sorted(subject_ids), 'changed': changed})
+
+
+@bp.route('/teacher/jobs/<int:job_id>')
+@teacher_required
+def teacher_job_status(job_id):
+    """Status of a background job this teacher started (JSON)."""
+    job = db.session.get(Job, job_id)
+    if job is None or job.created_by != f"teacher:{session.get('teacher_id')}":
+        return jsonify({'error': 'job not found'}), 404
+    return jsonify(job_as_dict(job))
+
+
+@bp.route('/teacher/results/bulk', methods=['POST'])
+@teacher_required
+def teacher_results_bulk():
+    # Auto-generate term label based on current month
+    now = datetime.utcnow()
+    term = term_label(now)
+    max_marks = float(request.form.get('max_marks') or 100)
+    cls = (request.form.get('class_name') or '').strip() or None
+    ids = request.form.getlist('student_id')
+
+    # Collect up to 6 subject names from headers
+    subject_names = []
+    for i in range(1, 7):
+        nm = (request.form.get(f'subject_name_{i}') or '').strip()
+        subject_names.append(nm)
+
+    # Helper: get or create Subject by name
+    def get_or_create_subject(name: str):
+        if not name:
+            return None
+        sub = Subject.query.filter_by(name=name).first()
+        if not sub:
+            sub = Subject(name=name, class_section_id=None)
+            db.session.add(sub)
+            db.session.flush()
+        return sub
+
+    # Upsert results per subject column: existing results for the term are loaded once and
+    # updated in place, so the change audit records old and new marks
+    subjects = {idx: get_or_create_subject(name) for idx, name in enumerate(subject_names, start=1)
+                if name and any(request.form.get(f'marks_{sid}_{idx}') for sid in ids)}
+    existing = {}
+    if ids and subjects:
+        for r in Result.query.filter(Result.student_id.in_([int(sid) for sid in ids]), Result.term == term,
+                                     Result.subject_id.in_([sub.id for sub in subjects.values()])).order_by(Result.id):
+            existing.setdefault((r.student_id, r.subject_id), []).append(r)
+    for sid in ids:
+        sid_int = int(sid)
+        for idx, sub in subjects.items():
+            marks_val = request.form.get(f'marks_{sid}_{idx}')
+            if marks_val is None or marks_val == '':
+                continue
+            marks = float(marks_val)
+            rows = existing.pop((sid_int, sub.id), [])
+            # Keep one result per (student, subject, term)
+            for extra in rows[1:]:
+                db.session.delete(extra)
+            if rows:
+                rec = rows[0]
+                rec.marks_obtained, rec.max_marks = marks, max_marks
+                rec.graded_by_teacher_id = session.get('teacher_id')
+            else:
+                db.session.add(Result(student_id=sid_int, subject_id=sub.id, term=term,
+                                      marks_obtained=marks, max_marks=max_marks,
+                                      graded_by_teacher_id=session.get('teacher_id')))
+
+    db.session.commit()
+    flash('Results saved for class', 'success')
+    return redirect(url_for('teacher_results_upload', **{
+        'class': cls or '',
+        'term': term or ''
+    }))
+
+
+@bp.route('/teacher/sports')
+@teacher_required
+@replica_reads
+def teacher_sports_page():
+    t = Teacher.query.get(session.get('teacher_id'))
+    class_list = catalog_classes()
+    section_list = catalog_sections()
+
+    cls = (request.args.get('class') or '').strip() or None
+    sec = (request.args.get('section') or '').strip() or None
+    students = class_roster(cls, sec)
+
+    return render_template('teacher_sports.html', teacher=t, class_list=class_list, section_list=section_list,
+                           selected_class=cls, selected_section=sec, students=students)
+
+
+@bp.route('/teacher/sports/bulk', methods=['POST'])
+@teacher_required
+def teacher_sports_bulk():
+    ids = request.form.getlist('student_id')
+    activity = (request.form.get('activity') or '').strip()
+    level = (request.form.get('level') or '').strip() or None
+    result_val = (request.form.get('result') or '').strip() or None
+    date_str = (request.form.get('date') or '').strip()
+    date_val = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else None
+    notes = (request.form.get('notes') or '').strip() or None
+    for sid in ids:
+        if not activity:
+            continue
+        rec = SportsActivity(student_id=int(sid), activity=activity, level=level, result=result_val,
+                             date=date_val, notes=notes, recorded_by_teacher_id=session.get('teacher_id'))
+        db.session.add(rec)
+    db.session.commit()
+    flash('Sports achievements recorded', 'success')
+    return redirect(url_for('teacher_sports_page', **{
+        'class': request.form.get('class_name') or '',
+        'section': request.form.get('section') or ''
+    }))
+
+
+@bp.route('/teacher/sports/leaderboard')
+@teacher_required
+@replica_reads
+def teacher_sports_leaderboard():
+    by = (request.args.get('by') or 'class').strip()
+    if by not in SPORTS_TALLY_DIMENSIONS:
+        by = 'class'
+    year = request.args.get('year', type=int)
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    tally = sports_medal_tally(by, year)
+    top = sports_top_students(limit, year)
+    if (request.args.get('format') or '').strip() == 'json':
+        return jsonify({'by': by, 'year': year, 'tally': tally, 'top_students': top,
+                        'weights': {'result': current_app.config['SPORTS_RESULT_POINTS'],
+                                    'level': current_app.config['SPORTS_LEVEL_WEIGHTS']}})
+    t = Teacher.query.get(session.get('teacher_id'))
+    return render_template('teacher_sports_leaderboard.html', teacher=t, by=by, year=year, limit=limit,
+                           tally=tally, top=top, dimensions=list(SPORTS_TALLY_DIMENSIONS),
+                           result_points=current_app.config['SPORTS_RESULT_POINTS'],
+                           level_weights=current_app.config['SPORTS_LEVEL_WEIGHTS'])
@@ -0,0 +1,211 @@
+"""Route-level benchmarks against a seeded SQLite database.
+
+Runs the hot routes through Flask's test client and records latency
+percentiles and SQL statement counts for each route. Results can be saved as a
+baseline JSON file and compared on later runs. The exit status is non-zero when
+a route regresses beyond the threshold.
+
+    python bench.py --save-baseline bench_baseline.json
+    python bench.py --baseline bench_baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DEFAULT_DB = os.path.join(tempfile.gettempdir(), 'schoolweb_bench.db')
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def build_routes(m, app, start_year):
+    """(name, role, method, path, form-or-json builder) for every benchmarked route."""
+    with app.app_context():
+        student = m.Student.query.filter(m.Student.class_name == '1').order_by(m.Student.roll_no).first()
+        class_students = m.Student.query.filter_by(class_name='1', section='A').order_by(m.Student.roll_no).all()
+        teacher = m.Teacher.query.order_by(m.Teacher.id.desc()).first()
+    month = f"{start_year}-07-01"
+
+    def attendance_form():
+        form = {'class_name': '1', 'date': month, 'student_id': [str(s.id) for s in class_students]}
+        for i, s in enumerate(class_students):
+            for day in range(1, 32):
+                if (i + day) % 7:
+                    form[f"status_{s.id}_{start_year}-07-{day:02d}"] = 'on'
+        return form
+
+    def results_form():
+        form = {'class_name': '1', 'section': 'A', 'max_marks': '100',
+                'student_id': [str(s.id) for s in class_students]}
+        for i, name in enumerate(m.SCALE_SUBJECTS, start=1):
+            form[f'subject_name_{i}'] = name
+            for j, s in enumerate(class_students):
+                form[f'marks_{s.id}_{i}'] = str(40 + (i * 7 + j * 3) % 60)
+        return form
+
+    routes = [
+        ('student_login', 'anon', 'POST', '/student/login',
+         lambda: {'data': {'roll_no': student.roll_no, 'password': 'password123'}}),
+        ('student_dashboard', 'student', 'GET', '/student/dashboard', None),
+        ('teacher_attendance_sheet', 'teacher', 'GET', f'/teacher/attendance/sheet?class=1&date={month}', None),
+        ('teacher_attendance_bulk', 'teacher', 'POST', '/teacher/attendance/bulk', lambda: {'data': attendance_form()}),
+        ('teacher_results_bulk', 'teacher', 'POST', '/teacher/results/bulk', lambda: {'data': results_form()}),
+        ('admin_dashboard', 'admin', 'GET', '/admin/dashboard', None),
+        ('admin_students_list', 'admin', 'GET', '/admin/students?page=3', None),
+        ('admin_students_list_legacy', 'admin', 'GET', '/admin/students?use_admissions=0&page=3', None),
+        ('admin_students_export', 'admin', 'GET', '/admin/students/export', None),
+        ('admin_teachers_list', 'admin', 'GET', '/admin/teachers', None),
+        ('admin_teachers_export', 'admin', 'GET', '/admin/teachers/export', None),
+        ('admin_audit', 'admin', 'GET', '/admin/audit?page=2&role=student', None),
+        ('admin_admissions_list', 'admin', 'GET', '/admin/admissions?status=confirmed&page=2', None),
+        ('admin_admissions_export', 'admin', 'GET', '/admin/admissions/export', None),
+        ('admin_users_list', 'admin', 'GET', '/admin/users?role=student&page=2', None),
+        ('admin_users_export', 'admin', 'GET', '/admin/users/export', None),
+        ('public_admission_apply', 'anon', 'POST', '/admissions/apply',
+         lambda: {'json': {'studentName': 'Bench Applicant', 'class': '1', 'fatherPhone': '9876543210'}}),
+    ]
+    return routes, teacher, student
+
+
+def login_clients(app, teacher, student):
+    clients = {'anon': app.test_client()}
+    c = app.test_client()
+    c.post('/student/login', data={'roll_no': student.roll_no, 'password': 'password123'})
+    clients['student'] = c
+    c = app.test_client()
+    c.post('/teacher/login', data={'username': teacher.username, 'password': 'password123'})
+    clients['teacher'] = c
+    c = app.test_client()
+    c.post('/admin/login', data={'username': 'admin', 'password': 'adminpass'})
+    clients['admin'] = c
+    return clients
+
+
+def run(m, routes, clients, iterations, warmup, only=None):
+    results = {}
+    for name, role, method, path, payload in routes:
+        if only and name not in only:
+            continue
+        client = clients[role]
+        kwargs = payload() if payload else {}
+        timings, queries, statuses = [], [], set()
+        for i in range(warmup + iterations):
+            with m.query_capture() as prof:
+                start = time.perf_counter()
+                resp = client.open(path, method=method, **kwargs)
+                resp.get_data()
+                elapsed = time.perf_counter() - start
+            if i < warmup:
+                continue
+            timings.append(elapsed * 1000)
+            queries.append(prof.count)
+            statuses.add(resp.status_code)
+        results[name] = {
+            'p50_ms': round(_percentile(timings, 0.50), 3),
+            'p95_ms': round(_percentile(timings, 0.95), 3),
+            'max_ms': round(max(timings), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': int(statistics.median(queries)),
+            'status': sorted(statuses),
+        }
+    return results
+
+
+def compare(current, baseline, threshold, min_delta_ms):
+    """Return a list of regression messages and print a comparison table."""
+    regressions = []
+    header = f"{'route':<30} {'p50':>9} {'p95':>9} {'queries':>8} {'base p95':>9} {'base q':>7} {'d p95':>8}  status"
+    print(header)
+    print('-' * len(header))
+    for name, cur in current.items():
+        base = (baseline or {}).get(name)
+        note = ''
+        if any(code >= 500 for code in cur['status']):
+            regressions.append(f"{name}: server error {cur['status']}")
+            note = 'ERROR'
+        if base:
+            delta = (cur['p95_ms'] - base['p95_ms']) / base['p95_ms'] if base['p95_ms'] else 0.0
+            if delta > threshold and cur['p95_ms'] - base['p95_ms'] > min_delta_ms:
+                regressions.append(f"{name}: p95 {base['p95_ms']:.1f}ms -> {cur['p95_ms']:.1f}ms (+{delta:.0%})")
+                note = note or 'SLOWER'
+            if cur['queries'] > base['queries']:
+                regressions.append(f"{name}: queries {base['queries']} -> {cur['queries']}")
+                note = note or 'MORE QUERIES'
+            print(f"{name:<30} {cur['p50_ms']:>9.2f} {cur['p95_ms']:>9.2f} {cur['queries']:>8} "
+                  f"{base['p95_ms']:>9.2f} {base['queries']:>7} {delta:>+8.0%}  {note or 'ok'}")
+        else:
+            print(f"{name:<30} {cur['p50_ms']:>9.2f} {cur['p95_ms']:>9.2f} {cur['queries']:>8} "
+                  f"{'-':>9} {'-':>7} {'-':>8}  {note or 'new'}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite file to benchmark (seeded when missing)')
+    parser.add_argument('--reseed', action='store_true', help='Delete and regenerate the database first')
+    parser.add_argument('--classes', type=int, default=6)
+    parser.add_argument('--sections', type=int, default=2)
+    parser.add_argument('--students', type=int, default=40, help='Students per section')
+    parser.add_argument('--years', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--start-year', type=int, default=2024)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--only', action='append', help='Benchmark only this route (repeatable)')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='Write results to this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed p95 slowdown (0.25 = 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help='Ignore p95 changes smaller than this')
+    args = parser.parse_args(argv)
+
+    if args.reseed and os.path.exists(args.db):
+        os.remove(args.db)
+    fresh = not os.path.exists(args.db)
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.abspath(args.db)}"
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as m
+    app = m.create_app()
+
+    with app.app_context():
+        if fresh:
+            m.ensure_db_and_sample()
+            counts = m.seed_scale(classes=args.classes, sections=args.sections, students=args.students,
+                                  years=args.years, seed=args.seed, start_year=args.start_year)
+            print(f"Seeded {args.db}: {sum(counts.values()):,} rows")
+
+    routes, teacher, student = build_routes(m, app, args.start_year)
+    clients = login_clients(app, teacher, student)
+    current = run(m, routes, clients, args.iterations, args.warmup, set(args.only or []))
+
+    baseline = None
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            baseline = json.load(fh).get('routes')
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as fh:
+            json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'iterations': args.iterations,
+                       'routes': current}, fh, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if regressions:
+        print('\nRegressions:')
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
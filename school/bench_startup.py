@@ -0,0 +1,113 @@
+"""Cold-start benchmark: how long a new worker process takes to import the app.
+
+Each run starts a fresh interpreter, imports the dependencies, then app.py, then
+builds the app with create_app() (config, the area modules, the schema guards),
+and reports the median of each phase. The exit status is non-zero when the
+median import of app.py, or of app.py and its dependencies together, exceeds
+its budget, so a module-level query or eager import creeping back in shows up
+as a failure. tests/test_startup.py runs the same probe under pytest.
+
+    python bench_startup.py
+    python bench_startup.py --areas none --runs 9 --app-budget-ms 80
+    python bench_startup.py --importtime 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+import flask, flask_sqlalchemy, sqlalchemy, dotenv
+t1 = time.perf_counter()
+import app as m
+t2 = time.perf_counter()
+imported = {'areas': sorted(name for name in sys.modules if name.startswith('areas')),
+            'database': os.path.exists(os.environ['DATABASE_URL'][len('sqlite:///'):])}
+application = m.create_app()
+t3 = time.perf_counter()
+print(json.dumps({'deps': t1 - t0, 'app': t2 - t1, 'create_app': t3 - t2, 'on_import': imported,
+                  'routes': len(list(application.url_map.iter_rules()))}))
+"""
+
+
+def _env(db_path, areas):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", PYTHONPATH=HERE)
+    # Deployed workers load cached bytecode: let the warm-up run write it
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if areas is not None:
+        env['SCHOOL_AREAS'] = areas
+    return env
+
+
+def probe(db_path, areas=None) -> dict:
+    out = subprocess.run([sys.executable, '-c', PROBE], env=_env(db_path, areas), cwd=HERE,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def importtime(db_path, areas=None, top=15) -> list:
+    """(self µs, cumulative µs, module) of the slowest imports, from python -X importtime."""
+    err = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], env=_env(db_path, areas),
+                         cwd=HERE, capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, total, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        rows.append((int(own), int(total), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--areas', default=None, help='SCHOOL_AREAS for the probes (default: all areas)')
+    parser.add_argument('--budget-ms', type=float, default=1000.0,
+                        help='Allowed median for dependencies plus app.py')
+    parser.add_argument('--app-budget-ms', type=float, default=150.0,
+                        help='Allowed median for the app.py module body alone')
+    parser.add_argument('--importtime', type=int, default=0, metavar='N',
+                        help='Also list the N imports with the most self time')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'startup.db')
+        probe(db_path, args.areas)  # warm-up: compiles bytecode and creates the schema
+        runs = [probe(db_path, args.areas) for _ in range(args.runs)]
+        slowest = importtime(db_path, args.areas, args.importtime) if args.importtime else []
+
+    med = {k: statistics.median(r[k] for r in runs) * 1000 for k in ('deps', 'app', 'create_app')}
+    total = med['deps'] + med['app']
+    print(f"{'phase':<16}{'median':>10}{'min':>10}{'max':>10}")
+    for key in ('deps', 'app', 'create_app'):
+        values = [r[key] * 1000 for r in runs]
+        print(f"{key:<16}{med[key]:>8.1f}ms{min(values):>8.1f}ms{max(values):>8.1f}ms")
+    print(f"{'import total':<16}{total:>8.1f}ms   ({runs[0]['routes']} URL rules, areas={args.areas or 'all'})")
+
+    if slowest:
+        print(f"\n{'self':>10}{'cumulative':>12}  module")
+        for own, cumulative, name in slowest:
+            print(f"{own / 1000:>8.1f}ms{cumulative / 1000:>10.1f}ms  {name}")
+
+    over = []
+    if med['app'] > args.app_budget_ms:
+        over.append(f"app.py body {med['app']:.1f}ms > {args.app_budget_ms:.0f}ms")
+    if total > args.budget_ms:
+        over.append(f"import total {total:.1f}ms > {args.budget_ms:.0f}ms")
+    if over:
+        print('\nOver budget:')
+        for line in over:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Multi-process concurrent-writer benchmark for the SQLite profiles.
+
+Runs the same workload twice, once with stock SQLite settings
+(SQLITE_TUNING=0) and once with the tuned profile (WAL, synchronous=NORMAL,
+busy_timeout, mmap, cache_size, temp_store). Writer processes save small
+attendance batches the way teachers do, each batch in its own commit, while
+reader processes keep running dashboard-style COUNT queries. The script
+prints commit throughput, latency percentiles and "database is locked"
+failures for each profile.
+
+    python bench_writers.py --writers 8 --readers 2 --txns 200
+"""
+import argparse
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_app(db_path, tuned):
+    os.environ['DATABASE_URL'] = f"sqlite:///{db_path}"
+    os.environ['SQLITE_TUNING'] = '1' if tuned else '0'
+    sys.path.insert(0, HERE)
+    import app as m
+    return m, m.create_app()
+
+
+def _writer(db_path, tuned, worker, txns, rows, start_evt, out):
+    from datetime import date, timedelta
+    import sqlalchemy as sa
+    m, app = _load_app(db_path, tuned)
+    latencies, locked, other = [], 0, 0
+    with app.app_context():
+        student_ids = [sid for (sid,) in m.db.session.query(m.Student.id).order_by(m.Student.id)]
+        m.db.session.rollback()
+        start_evt.wait()
+        base = date(2025, 1, 1) + timedelta(days=worker * txns)
+        for i in range(txns):
+            day = base + timedelta(days=i)
+            batch = [student_ids[(worker * 7 + i + k) % len(student_ids)] for k in range(rows)]
+            t0 = time.perf_counter()
+            try:
+                m.Attendance.query.filter(m.Attendance.date == day, m.Attendance.student_id.in_(batch)).delete(
+                    synchronize_session=False)
+                m.db.session.execute(sa.insert(m.Attendance.__table__), [
+                    {'student_id': sid, 'subject_id': None, 'date': day, 'status': 'Present',
+                     'marked_by_teacher_id': None} for sid in batch
+                ])
+                m.db.session.commit()
+                latencies.append(time.perf_counter() - t0)
+            except sa.exc.OperationalError as exc:
+                m.db.session.rollback()
+                if 'locked' in str(exc).lower():
+                    locked += 1
+                else:
+                    other += 1
+    out.put(('writer', latencies, locked, other))
+
+
+def _reader(db_path, tuned, start_evt, stop_evt, out):
+    import sqlalchemy as sa
+    m, app = _load_app(db_path, tuned)
+    queries, locked = 0, 0
+    with app.app_context():
+        start_evt.wait()
+        while not stop_evt.is_set():
+            try:
+                m.db.session.execute(sa.text('SELECT COUNT(*) FROM attendance')).scalar()
+                m.db.session.execute(sa.text("SELECT COUNT(*) FROM attendance WHERE status = 'Present'")).scalar()
+                m.db.session.rollback()
+                queries += 2
+            except sa.exc.OperationalError:
+                m.db.session.rollback()
+                locked += 1
+    out.put(('reader', queries, locked, 0))
+
+
+def _prepare(template):
+    path = os.path.join(tempfile.mkdtemp(prefix='schoolweb_writers_'), 'bench.db')
+    shutil.copyfile(template, path)
+    return path
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+def run_profile(template, tuned, args):
+    db_path = _prepare(template)
+    ctx = mp.get_context('spawn')
+    out = ctx.Queue()
+    start_evt, stop_evt = ctx.Event(), ctx.Event()
+    writers = [ctx.Process(target=_writer, args=(db_path, tuned, w, args.txns, args.rows, start_evt, out))
+               for w in range(args.writers)]
+    readers = [ctx.Process(target=_reader, args=(db_path, tuned, start_evt, stop_evt, out))
+               for _ in range(args.readers)]
+    for p in writers + readers:
+        p.start()
+    time.sleep(args.startup_wait)  # let every process import the app before the clock starts
+    t0 = time.perf_counter()
+    start_evt.set()
+    latencies, locked, other = [], 0, 0
+    for _ in writers:
+        _, lat, lk, ot = out.get()
+        latencies.extend(lat)
+        locked += lk
+        other += ot
+    elapsed = time.perf_counter() - t0
+    stop_evt.set()
+    reads, read_locked = 0, 0
+    for _ in readers:
+        _, q, lk, _ = out.get()
+        reads += q
+        read_locked += lk
+    for p in writers + readers:
+        p.join()
+    shutil.rmtree(os.path.dirname(db_path), ignore_errors=True)
+    return {
+        'commits': len(latencies),
+        'commits_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p95_ms': _percentile(latencies, 0.95) * 1000,
+        'locked': locked,
+        'errors': other,
+        'reads_per_s': reads / elapsed if elapsed else 0.0,
+        'read_locked': read_locked,
+        'elapsed_s': elapsed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=2)
+    parser.add_argument('--txns', type=int, default=150, help='Commits per writer process')
+    parser.add_argument('--rows', type=int, default=30, help='Attendance rows per commit')
+    parser.add_argument('--students', type=int, default=40, help='Students per section in the seeded template')
+    parser.add_argument('--startup-wait', type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    # Seed one template database (stock settings) and copy it for each profile
+    template = os.path.join(tempfile.mkdtemp(prefix='schoolweb_template_'), 'template.db')
+    m, app = _load_app(template, tuned=False)
+    with app.app_context():
+        m.ensure_db_and_sample()
+        m.seed_scale(classes=2, sections=2, students=args.students, years=1, teachers=4, log=lambda *_: None)
+        m.db.session.remove()
+        m.db.engine.dispose()
+
+    results = {}
+    for label, tuned in (('stock', False), ('tuned', True)):
+        print(f"Running {label} profile: {args.writers} writers x {args.txns} commits, {args.readers} readers ...")
+        results[label] = run_profile(template, tuned, args)
+
+    header = f"{'profile':<8} {'commits':>8} {'commits/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'locked':>7} {'reads/s':>9} {'read locked':>12}"
+    print()
+    print(header)
+    print('-' * len(header))
+    for label, r in results.items():
+        print(f"{label:<8} {r['commits']:>8} {r['commits_per_s']:>10.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+              f"{r['locked']:>7} {r['reads_per_s']:>9.1f} {r['read_locked']:>12}")
+    if results['stock']['commits_per_s']:
+        print(f"\nthroughput x{results['tuned']['commits_per_s'] / results['stock']['commits_per_s']:.2f} with the tuned profile")
+    shutil.rmtree(os.path.dirname(template), ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
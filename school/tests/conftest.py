@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as school  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A fresh app on its own SQLite file, with the demo accounts seeded."""
+    application = school.create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'school.db'}",
+        'CACHE_BACKEND': 'memory',
+        'EXPORTS_DIR': str(tmp_path / 'exports'),
+        'NOTIFY_FILE': str(tmp_path / 'notifications.jsonl'),
+        'METRICS_DIR': None,
+    })
+    with application.app_context():
+        school.ensure_db_and_sample()
+        school.db.session.commit()
+    yield application
+    with application.app_context():
+        school.db.session.remove()
+        for engine in school.db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def login(client, role: str):
+    """Log `client` in as the seeded student, teacher or admin."""
+    path, form = {
+        'student': ('/student/login', {'roll_no': '2024001', 'password': 'password123'}),
+        'teacher': ('/teacher/login', {'username': 'teacher1', 'password': 'teachpass'}),
+        'admin': ('/admin/login', {'username': 'admin', 'password': 'adminpass'}),
+    }[role]
+    response = client.post(path, data=form)
+    assert response.status_code == 302, response.data[:500]
+    return client
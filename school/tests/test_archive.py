@@ -0,0 +1,40 @@
+from datetime import date
+
+import sqlalchemy as sa
+
+import app as school
+
+
+def test_term_labels_follow_the_academic_year_of_their_start(app):
+    with app.app_context():
+        assert school._term_year('SUMMER 2025') == 2025
+        assert school._term_year('WINTER 2025') == 2024
+        assert school._term_year('Term 2025') == 2025
+        assert school._term_year('unlabelled') is None
+        assert school.term_label(date(2025, 4, 15)) == 'WINTER 2025'
+        assert school.term_label(date(2025, 10, 1)) == 'SUMMER 2025'
+        for d in (date(2025, 6, 1), date(2025, 9, 30), date(2025, 10, 1), date(2025, 12, 31), date(2026, 1, 1),
+                  date(2026, 3, 31), date(2026, 4, 15), date(2026, 5, 31)):
+            assert school._term_year(school.term_label(d)) == school.academic_year_of(d) == 2025
+
+
+def test_term_labels_follow_configured_start_months(app):
+    # Terms from April and October: a date before April is still in last October's term
+    app.config.update(ACADEMIC_YEAR_START_MONTH=4, TERM_START_MONTHS={'SPRING': 4, 'AUTUMN': 10})
+    with app.app_context():
+        assert school.term_label(date(2026, 2, 1)) == 'AUTUMN 2025'
+        for d in (date(2025, 4, 1), date(2025, 9, 30), date(2025, 10, 1), date(2026, 3, 31)):
+            assert school._term_year(school.term_label(d)) == school.academic_year_of(d) == 2025
+
+
+def test_history_places_winter_results_in_the_previous_academic_year(app):
+    with app.app_context():
+        student, subject = school.Student.query.first(), school.Subject.query.first()
+        for term in ('SUMMER 2030', 'WINTER 2031'):
+            school.db.session.add(school.Result(student_id=student.id, subject_id=subject.id, term=term,
+                                                marks_obtained=50, max_marks=100))
+        school.db.session.commit()
+        h = school.history_select(school.Result)
+        years = dict(school.db.session.execute(
+            sa.select(h.c.term, h.c.academic_year).where(h.c.term.in_(['SUMMER 2030', 'WINTER 2031']))).all())
+        assert years == {'SUMMER 2030': 2030, 'WINTER 2031': 2030}
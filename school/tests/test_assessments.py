@@ -0,0 +1,90 @@
+import app as school
+from conftest import login
+
+TERM = 'SUMMER 2025'
+
+
+def _setup(app):
+    """A class 9A student and the seeded subject ids."""
+    with app.app_context():
+        student = school.Student(roll_no='AS-1', name='Asha', class_name='9', section='A', password_hash='x')
+        school.db.session.add(student)
+        school.db.session.commit()
+        subjects = {s.name: s.id for s in school.Subject.query}
+        return student.id, subjects['Mathematics'], subjects['Science']
+
+
+def _score(sid, subject_id, component, score, max_score):
+    school.db.session.add(school.Assessment(student_id=sid, subject_id=subject_id, component=component,
+                                            term=TERM, score=score, max_score=max_score))
+
+
+def test_weighted_score_skips_missing_components(app):
+    sid, maths, science = _setup(app)
+    with app.app_context():
+        _score(sid, maths, 'Unit Test', 20, 25)  # 80%, weight 0.2
+        _score(sid, maths, 'Term', 40, 80)  # 50%, weight 0.5
+        _score(sid, science, 'Term', 60, 80)  # 75%
+        school.db.session.commit()
+        scores = school.class_term_scores('9', 'A', TERM)[sid]
+        assert scores['subjects'] == {maths: 58.6, science: 75.0}
+        assert scores['overall'] == 66.8
+
+
+def test_subject_weights_override_the_school_default(app):
+    sid, maths, science = _setup(app)
+    with app.app_context():
+        _score(sid, maths, 'Unit Test', 20, 25)
+        _score(sid, maths, 'Term', 40, 80)
+        _score(sid, science, 'Unit Test', 20, 25)
+        _score(sid, science, 'Term', 40, 80)
+        school.set_assessment_weights(None, {'Unit Test': (0.0, 25.0)})
+        school.set_assessment_weights(maths, {'Unit Test': (0.5, 25.0), 'Term': (0.5, 80.0)})
+        school.db.session.commit()
+        subjects = school.class_term_scores('9', 'A', TERM)[sid]['subjects']
+        assert subjects == {maths: 65.0, science: 50.0}
+        assert {c['component']: c['weight'] for c in school.assessment_components(science)}['Unit Test'] == 0.0
+
+
+def test_cached_scores_follow_new_and_replaced_scores(app):
+    sid, maths, _ = _setup(app)
+    with app.app_context():
+        _score(sid, maths, 'Term', 40, 80)
+        school.db.session.commit()
+        assert school.class_term_scores('9', 'A', TERM)[sid]['overall'] == 50.0
+        school.save_assessment_grid(maths, TERM, {(sid, 'Term'): 60.0}, {'Term': 80.0})
+        school.db.session.commit()
+        assert school.class_term_scores('9', 'A', TERM)[sid]['overall'] == 75.0
+        _score(sid, maths, 'Unit Test', 25, 25)
+        school.db.session.commit()
+        assert school.class_term_scores('9', 'A', TERM)[sid]['overall'] == 82.1
+        rows = school.Assessment.query.filter_by(student_id=sid, component='Term').all()
+        assert [r.score for r in rows] == [60.0]
+
+
+def test_teacher_grid_saves_and_shows_scores(app, client):
+    sid, maths, _ = _setup(app)
+    login(client, 'teacher')
+    response = client.post('/teacher/assessments/bulk', data={
+        'class_name': '9', 'section': 'A', 'term': TERM, 'subject_id': maths, 'student_id': [str(sid)],
+        'component_1': 'Unit Test', 'max_1': '25', 'component_2': 'Term', 'max_2': '80',
+        f'score_{sid}_1': '20', f'score_{sid}_2': '',
+    })
+    assert response.status_code == 302
+    with app.app_context():
+        rows = school.Assessment.query.filter_by(student_id=sid).all()
+        assert [(r.component, r.score, r.max_score) for r in rows] == [('Unit Test', 20.0, 25.0)]
+    page = client.get(f'/teacher/assessments?class=9&section=A&term={TERM}&subject={maths}')
+    assert page.status_code == 200
+    assert 'Asha' in page.get_data(as_text=True)
+
+
+def test_teacher_grid_rejects_scores_above_the_maximum(app, client):
+    sid, maths, _ = _setup(app)
+    login(client, 'teacher')
+    client.post('/teacher/assessments/bulk', data={
+        'class_name': '9', 'section': 'A', 'term': TERM, 'subject_id': maths, 'student_id': [str(sid)],
+        'component_1': 'Unit Test', 'max_1': '25', f'score_{sid}_1': '30',
+    })
+    with app.app_context():
+        assert school.Assessment.query.filter_by(student_id=sid).count() == 0
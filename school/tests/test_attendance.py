@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+
+import app as school
+from conftest import login
+
+
+@pytest.mark.parametrize('body', [[], ['rows'], 'rows', 7])
+def test_delta_rejects_a_body_that_is_not_an_object(client, body):
+    login(client, 'teacher')
+    r = client.post('/teacher/attendance/delta', json=body)
+    assert r.status_code == 400
+    assert 'object' in r.json['error']
+
+
+@pytest.mark.parametrize('rows', [['PPA'], 'PPA', 3])
+def test_delta_rejects_rows_that_are_not_an_object(client, rows):
+    login(client, 'teacher')
+    r = client.post('/teacher/attendance/delta', json={'class_name': '1', 'date': '2024-07-01', 'rows': rows})
+    assert r.status_code == 400
+    assert 'rows' in r.json['error']
+
+
+def test_sheet_queries_do_not_grow_with_the_class(app, client):
+    with app.app_context():
+        for n in range(30):
+            student = school.Student(roll_no=f"10-{n:03d}", name=f"Student {n}", password_hash='x',
+                                     class_name='10', section='A')
+            school.db.session.add(student)
+            school.db.session.flush()
+            school.db.session.add_all([school.Attendance(student_id=student.id, date=date.today().replace(day=d),
+                                                         status='Present') for d in (1, 2)])
+        school.db.session.commit()
+    login(client, 'teacher')
+    with school.assert_max_queries(12):  # cold caches
+        assert client.get('/teacher/attendance/sheet?class=10').status_code == 200
+    with school.assert_max_queries(6):
+        assert client.get('/teacher/attendance/sheet?class=10').status_code == 200
+
+
+def _two_sections(app):
+    with app.app_context():
+        ids = {}
+        for sec in ('A', 'B'):
+            student = school.Student(roll_no=f"10{sec}-001", name=f"Pupil {sec}", password_hash='x',
+                                     class_name='10', section=sec)
+            school.db.session.add(student)
+            school.db.session.flush()
+            ids[sec] = student.id
+        school.db.session.commit()
+        return ids
+
+
+def _sheet_version(client, sec):
+    html = client.get(f'/teacher/attendance/sheet?class=10&section={sec}&date=2024-07-01').data.decode()
+    return html.split('data-version="')[1].split('"')[0], html
+
+
+def test_sheet_shows_and_versions_one_section(app, client):
+    ids = _two_sections(app)
+    login(client, 'teacher')
+    version_a, html = _sheet_version(client, 'A')
+    assert 'Pupil A' in html and 'Pupil B' not in html
+    version_b, _ = _sheet_version(client, 'B')
+    r = client.post('/teacher/attendance/delta', json={'class_name': '10', 'section': 'B', 'date': '2024-07-01',
+                                                       'version': version_b, 'rows': {str(ids['B']): 'PA'}})
+    assert r.status_code == 200 and r.json['saved'] == 2
+    # A save in 10-B is no conflict for a teacher on 10-A
+    assert _sheet_version(client, 'A')[0] == version_a
+    r = client.post('/teacher/attendance/delta', json={'class_name': '10', 'section': 'A', 'date': '2024-07-01',
+                                                       'version': version_a, 'rows': {str(ids['A']): 'P'}})
+    assert r.status_code == 200
+
+
+def test_delta_ignores_students_outside_the_section(app, client):
+    ids = _two_sections(app)
+    login(client, 'teacher')
+    version_a, _ = _sheet_version(client, 'A')
+    r = client.post('/teacher/attendance/delta', json={'class_name': '10', 'section': 'A', 'date': '2024-07-01',
+                                                       'version': version_a,
+                                                       'rows': {str(ids['A']): 'P', str(ids['B']): 'A'}})
+    assert r.json['saved'] == 1
+    with app.app_context():
+        assert school.Attendance.query.filter_by(student_id=ids['B']).count() == 0
@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timedelta
+
+import app as school
+from conftest import login
+
+
+def _changes(**filters):
+    return [school.change_as_dict(c) for c in school.change_audit_page(filters, limit=500)[0]]
+
+
+def _student_id():
+    return school.Student.query.filter_by(roll_no='2024001').one().id
+
+
+def test_orm_changes_are_recorded_with_old_and_new_values(app):
+    with app.app_context():
+        payment = school.FeePayment(student_id=_student_id(), amount=100.0, mode='Cash')
+        school.db.session.add(payment)
+        school.db.session.commit()
+        payment.amount = 150.0
+        school.db.session.commit()
+        school.db.session.delete(payment)
+        school.db.session.commit()
+        changes = _changes(table='fee_payments')
+        assert [c['action'] for c in changes] == ['delete', 'update', 'insert']
+        assert changes[1]['old'] == {'amount': 100.0} and changes[1]['new'] == {'amount': 150.0}
+        assert changes[2]['new']['mode'] == 'Cash' and changes[0]['old']['amount'] == 150.0
+        assert {c['actor'] for c in changes} == {'system'}
+
+
+def test_rolled_back_changes_leave_no_entries(app):
+    with app.app_context():
+        school.db.session.add(school.FeePayment(student_id=_student_id(), amount=100.0))
+        school.db.session.flush()
+        school.db.session.rollback()
+        assert _changes() == []
+
+
+def test_grid_saves_record_only_changed_cells(app):
+    with app.app_context():
+        sid = _student_id()
+        subject = school.Subject.query.first().id
+        max_scores = {'Term': 80.0, 'Project': 15.0}
+        school.save_assessment_grid(subject, 'SUMMER 2025', {(sid, 'Term'): 50.0, (sid, 'Project'): 10.0}, max_scores)
+        school.db.session.commit()
+        school.save_assessment_grid(subject, 'SUMMER 2025', {(sid, 'Term'): 50.0, (sid, 'Project'): 12.0}, max_scores)
+        school.db.session.commit()
+        changes = _changes(table='assessments')
+        assert [c['action'] for c in changes] == ['update', 'insert', 'insert']
+        assert changes[0]['old'] == {'score': 10.0} and changes[0]['new'] == {'score': 12.0}
+
+
+def test_request_changes_name_the_actor_and_show_in_the_viewer(app, client):
+    with app.app_context():
+        sid = _student_id()
+    login(client, 'teacher')
+    client.post('/teacher/fee', data={'student_id': sid, 'amount': '200', 'mode': 'UPI'})
+    login(client, 'admin')
+    response = client.get('/admin/changes?format=json&actor=teacher&student=2024001')
+    assert response.status_code == 200
+    changes = response.json['changes']
+    assert len(changes) == 1 and changes[0]['actor'].startswith('teacher:')
+    assert changes[0]['new']['amount'] == 200.0
+    assert client.get('/admin/changes').status_code == 200
+
+
+def test_viewer_pages_by_id(app, client):
+    with app.app_context():
+        sid = _student_id()
+        for amount in range(5):
+            school.db.session.add(school.FeePayment(student_id=sid, amount=float(amount)))
+            school.db.session.commit()
+    login(client, 'admin')
+    first = client.get('/admin/changes?format=json&limit=3').json
+    second = client.get(f"/admin/changes?format=json&limit=3&before={first['next_before']}").json
+    assert len(first['changes']) == 3 and len(second['changes']) == 2
+    assert second['next_before'] is None
+    assert [c['new']['amount'] for c in first['changes'] + second['changes']] == [4.0, 3.0, 2.0, 1.0, 0.0]
+
+
+def test_auditing_can_be_switched_off_and_pruned(app):
+    app.config['AUDIT_CHANGES'] = False
+    with app.app_context():
+        school.db.session.add(school.FeePayment(student_id=_student_id(), amount=1.0))
+        school.db.session.commit()
+        assert _changes() == []
+        school.db.session.add(school.ChangeAudit(table_name='results', action='insert', actor='system',
+                                                 new_values=json.dumps({'x': 1}),
+                                                 changed_at=datetime.utcnow() - timedelta(days=400)))
+        school.db.session.commit()
+    result = app.test_cli_runner().invoke(args=['audit-prune', '--days', '365'])
+    assert 'Deleted 1 change audit entries' in result.output
@@ -0,0 +1,44 @@
+import json
+
+import bench
+
+
+def _route(p95, queries=3, status=(200,)):
+    return {'p50_ms': p95 / 2, 'p95_ms': p95, 'max_ms': p95, 'mean_ms': p95 / 2, 'queries': queries,
+            'status': list(status)}
+
+
+def test_percentile_interpolates():
+    assert bench._percentile([], 0.5) == 0.0
+    assert bench._percentile([4, 1, 3, 2], 0.5) == 2.5
+    assert bench._percentile([1, 2, 3, 4, 5], 0.95) == 4.8
+
+
+def test_compare_flags_slowdowns_extra_queries_and_errors(capsys):
+    baseline = {'fast': _route(10), 'steady': _route(10), 'chatty': _route(10, queries=3)}
+    current = {'fast': _route(20), 'steady': _route(11), 'chatty': _route(10, queries=4),
+               'broken': _route(1, status=(200, 500))}
+    regressions = bench.compare(current, baseline, threshold=0.25, min_delta_ms=2.0)
+    assert len(regressions) == 3
+    assert regressions[0].startswith('fast: p95')
+    assert regressions[1] == 'chatty: queries 3 -> 4'
+    assert regressions[2].startswith('broken: server error')
+    notes = {line.split()[0]: line.split()[-1] for line in capsys.readouterr().out.splitlines()[2:]}
+    assert notes == {'fast': 'SLOWER', 'steady': 'ok', 'chatty': 'QUERIES', 'broken': 'ERROR'}
+
+
+def test_compare_ignores_slowdowns_below_the_minimum_delta():
+    assert bench.compare({'tiny': _route(1.5)}, {'tiny': _route(1.0)}, threshold=0.25, min_delta_ms=2.0) == []
+
+
+def test_bench_runs_every_route_and_compares_with_its_baseline(tmp_path, monkeypatch):
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    baseline = tmp_path / 'baseline.json'
+    args = ['--db', str(tmp_path / 'bench.db'), '--classes', '1', '--sections', '1', '--students', '3',
+            '--iterations', '1', '--warmup', '0']
+    assert bench.main(args + ['--save-baseline', str(baseline)]) == 0
+    routes = json.loads(baseline.read_text())['routes']
+    assert all(max(r['status']) < 500 for r in routes.values()), routes
+    assert 'teacher_results_bulk' in routes
+    assert bench.main(args + ['--baseline', str(baseline), '--only', 'admin_dashboard',
+                              '--threshold', '100', '--min-delta-ms', '1000']) == 0
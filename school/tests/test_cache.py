@@ -0,0 +1,126 @@
+import time
+
+import pytest
+from flask import g
+
+import app as school
+from conftest import login
+
+BACKENDS = {
+    'memory': lambda tmp_path: school.MemoryCacheBackend(100),
+    'filesystem': lambda tmp_path: school.FileCacheBackend(str(tmp_path / 'cache'), 100),
+    'shared': lambda tmp_path: school.SharedCacheBackend(str(tmp_path / 'cache.sqlite'), 100),
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request, tmp_path):
+    return BACKENDS[request.param](tmp_path)
+
+
+def test_get_set_delete(app, backend):
+    cache = school.Cache(backend, default_ttl=60)
+    with app.app_context():
+        assert cache.get('k', 'absent') == 'absent'
+        cache.set('k', {'rows': [1, 2]})
+        cache.set(('tuple', 1), 'keyed by repr')
+        assert cache.get('k') == {'rows': [1, 2]}
+        assert cache.get(('tuple', 1)) == 'keyed by repr'
+        cache.delete('k')
+        assert cache.get('k') is None
+        assert cache.stats()['hits'] == 2
+
+
+def test_entries_expire_after_their_ttl(app, backend, monkeypatch):
+    cache = school.Cache(backend, default_ttl=60)
+    with app.app_context():
+        cache.set('short', 1, ttl=5)
+        cache.set('forever', 2, ttl=0)
+        later = time.time() + 120
+        monkeypatch.setattr(school.time, 'time', lambda: later)
+        assert cache.get('short') is None
+        assert cache.get('forever') == 2
+
+
+def test_invalidating_a_tag_reaches_every_worker_sharing_the_backend(app, backend):
+    worker_a, worker_b = school.Cache(backend), school.Cache(backend)
+    with app.app_context():
+        worker_a.set('counts', 10, tags=('counters',))
+        worker_a.set('both', 20, tags=('counters', 'subjects'))
+        worker_a.set('names', 30, tags=('subjects',))
+        assert worker_b.get('counts') == 10
+        worker_b.invalidate_tags('counters')
+        assert worker_a.get('counts') is None and worker_a.get('both') is None
+        assert worker_a.get('names') == 30
+        worker_a.set('counts', 11, tags=('counters',))
+        assert worker_b.get('counts') == 11
+
+
+def test_keys_are_scoped_to_the_tenant(app, backend):
+    cache = school.Cache(backend)
+    with app.app_context():
+        cache.set('dashboard', 'default school')
+    with app.app_context():
+        g.tenant = 'northside'
+        assert cache.get('dashboard') is None
+        cache.set('dashboard', 'northside')
+    with app.app_context():
+        assert cache.get('dashboard') == 'default school'
+
+
+def test_memoize_caches_per_arguments(app):
+    cache = school.Cache(school.MemoryCacheBackend(10))
+    calls = []
+
+    @cache.memoize(ttl=60, tags=('subjects',))
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    with app.app_context():
+        assert [square(3), square(3), square(4)] == [9, 9, 16]
+        square.invalidate(3)
+        assert square(3) == 9
+        cache.invalidate_tags('subjects')
+        assert square(4) == 16
+    assert calls == [3, 4, 3, 4]
+
+
+def test_memory_backend_evicts_the_least_recently_used(app):
+    cache = school.Cache(school.MemoryCacheBackend(2))
+    with app.app_context():
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert (cache.get('a'), cache.get('b'), cache.get('c')) == (1, None, 3)
+        assert cache.stats()['evictions'] == 1
+
+
+def test_a_failing_backend_behaves_like_a_miss(app):
+    class Broken(school.NullCacheBackend):
+        def get(self, key):
+            raise ConnectionError('down')
+
+        def set(self, key, payload, expires_at):
+            raise ConnectionError('down')
+
+    cache = school.Cache(Broken())
+    with app.app_context():
+        assert cache.get_or_set('k', lambda: 'computed') == 'computed'
+        assert cache.stats()['errors'] >= 2
+
+
+def test_dashboard_counters_are_cached_until_reconciled(app, client):
+    login(client, 'admin')
+    with app.app_context():
+        before = school.dashboard_counters()['students']
+        school.db.session.add(school.Student(roll_no='CACHE-1', name='Cached', password_hash='x'))
+        school.db.session.commit()
+        assert school.dashboard_counters()['students'] == before  # within COUNTERS_CACHE_SECONDS
+        school.reconcile_counters()  # invalidates the 'counters' tag
+        assert school.dashboard_counters()['students'] == before + 1
+    stats = client.get('/admin/cache?format=json').json
+    assert stats['backend'] == 'memory' and stats['invalidations'] >= 1
+    assert client.post('/admin/cache/clear').status_code == 302
+    assert client.get('/admin/cache?format=json').json['entries'] == 0
@@ -0,0 +1,63 @@
+import gzip
+
+import app as school
+from conftest import login
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+def test_pages_are_gzipped_for_clients_that_accept_it(client):
+    plain = client.get('/admin/login')
+    packed = client.get('/admin/login', headers=GZIP)
+    assert 'Content-Encoding' not in plain.headers
+    assert packed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in plain.headers['Vary'] and 'Accept-Encoding' in packed.headers['Vary']
+    assert gzip.decompress(packed.data) == plain.data
+    assert packed.content_length < plain.content_length
+
+
+def test_small_bodies_are_sent_as_is(app, client):
+    app.config['COMPRESS_MIN_SIZE'] = 10 ** 6
+    response = client.get('/admin/login', headers=GZIP)
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_matching_etag_gets_an_empty_304(client):
+    first = client.get('/admin/login', headers=GZIP)
+    etag = first.headers['ETag']
+    assert etag.startswith('W/')
+    assert client.get('/admin/login').headers['ETag'] == etag  # same tag with or without gzip
+    again = client.get('/admin/login', headers={**GZIP, 'If-None-Match': etag})
+    assert again.status_code == 304 and again.data == b''
+    assert 'Content-Encoding' not in again.headers
+    stale = client.get('/admin/login', headers={'If-None-Match': 'W/"something-else"'})
+    assert stale.status_code == 200 and stale.data
+
+
+def test_session_pages_revalidate_privately(client):
+    login(client, 'admin')
+    response = client.get('/admin/dashboard')
+    assert response.headers['ETag']
+    assert response.cache_control.no_cache and response.cache_control.private
+
+
+def test_streamed_downloads_are_gzipped_in_chunks(app, client):
+    app.config.update(COMPRESS_MIN_SIZE=0, COMPRESS_STREAM_FLUSH=16)
+    with app.app_context():
+        csv_file = school.write_admin_export('students', {}, 'csv')['file']
+        gz_file = school.write_admin_export('students', {}, 'csv.gz')['file']
+    login(client, 'admin')
+    plain = client.get(f'/admin/exports/files/{csv_file}')
+    packed = client.get(f'/admin/exports/files/{csv_file}', headers=GZIP)
+    assert packed.headers['Content-Encoding'] == 'gzip' and 'Content-Length' not in packed.headers
+    assert gzip.decompress(packed.data) == plain.data
+    # Already gzip: sent as stored
+    archive = client.get(f'/admin/exports/files/{gz_file}', headers=GZIP)
+    assert 'Content-Encoding' not in archive.headers
+    assert gzip.decompress(archive.data) == plain.data
+
+
+def test_range_requests_and_disabled_compression_pass_through(app, client):
+    assert 'Content-Encoding' not in client.get('/admin/login', headers={**GZIP, 'Range': 'bytes=0-10'}).headers
+    app.config['COMPRESS_RESPONSES'] = False
+    assert 'Content-Encoding' not in client.get('/admin/login', headers=GZIP).headers
@@ -0,0 +1,49 @@
+import sqlalchemy as sa
+
+import app as school
+
+
+def _add_student(roll_no):
+    student = school.Student(roll_no=roll_no, name=f"Student {roll_no}", password_hash='x')
+    school.db.session.add(student)
+    school.db.session.commit()
+    return student
+
+
+def test_counters_track_creates_and_deletes(app):
+    with app.app_context():
+        before = school.read_counters()
+        student = _add_student('C-1')
+        assert school.read_counters()['students'] == before['students'] + 1
+        school.db.session.delete(student)
+        school.db.session.commit()
+        assert school.read_counters() == before
+
+
+def test_read_counters_returns_only_source_totals(app):
+    with app.app_context():
+        school.reconcile_counters()
+        school.counter_version('students_version')
+        _add_student('C-2')
+        assert set(school.read_counters()) == set(school.COUNTER_SOURCES)
+
+
+def test_bump_on_a_missing_row_creates_it_and_the_total_is_recounted(app):
+    with app.app_context():
+        school.read_counters()
+        school.AppCounter.query.filter_by(name='students').delete()
+        school.db.session.commit()
+        _add_student('C-3')
+        row = school.db.session.get(school.AppCounter, 'students')
+        assert (row.value, row.reconciled_at) == (1, None)
+        total = school.db.session.execute(sa.select(sa.func.count()).select_from(school.Student)).scalar()
+        assert school.read_counters()['students'] == total
+        assert school.db.session.get(school.AppCounter, 'students').reconciled_at is not None
+
+
+def test_bump_creates_a_missing_version_row(app):
+    with app.app_context():
+        school._bump_counter(school.db.session.connection(), 'fresh_version', 1)
+        school._bump_counter(school.db.session.connection(), 'fresh_version', 1)
+        school.db.session.commit()
+        assert school.counter_version('fresh_version') == 2
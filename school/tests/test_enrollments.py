@@ -0,0 +1,80 @@
+import app as school
+from conftest import login
+
+
+def _class(app, count=3, class_name='6', section='A'):
+    with app.app_context():
+        students = [school.Student(roll_no=f"EN-{section}{i}", name=f"Student {i}", class_name=class_name,
+                                   section=section, password_hash='x') for i in range(count)]
+        school.db.session.add_all(students)
+        school.db.session.commit()
+        subjects = {s.name: s.id for s in school.Subject.query}
+        return [s.id for s in students], subjects
+
+
+def _map(client, **args):
+    response = client.get('/teacher/enrollments', query_string=args)
+    assert response.status_code == 200
+    return {int(sid): sorted(subjects) for sid, subjects in response.json['students'].items()}
+
+
+def test_enrolling_a_class_skips_existing_pairs(app, client):
+    ids, subjects = _class(app)
+    login(client, 'teacher')
+    payload = {'class_name': '6', 'subjects': ['Mathematics', subjects['Science']]}
+    response = client.post('/teacher/enrollments', json=payload)
+    assert response.status_code == 200
+    assert response.json['changed'] == 6
+    assert client.post('/teacher/enrollments', json=payload).json['changed'] == 0
+    both = sorted([subjects['Mathematics'], subjects['Science']])
+    assert _map(client, **{'class': '6'}) == {sid: both for sid in ids}
+
+
+def test_unenrolling_listed_students(app, client):
+    ids, subjects = _class(app)
+    login(client, 'teacher')
+    client.post('/teacher/enrollments', json={'class_name': '6', 'subjects': ['English']})
+    response = client.post('/teacher/enrollments', json={'action': 'unenroll', 'student_ids': ids[:2],
+                                                         'subjects': ['English']})
+    assert response.json['changed'] == 2
+    assert _map(client, **{'class': '6'}) == {ids[2]: [subjects['English']]}
+
+
+def test_bad_requests_are_rejected(app, client):
+    _class(app)
+    login(client, 'teacher')
+    cases = [
+        ({'class_name': '6', 'subjects': ['Astrology']}, 'unknown subjects'),
+        ({'subjects': ['English']}, 'class_name, section or student_ids is required'),
+        ({'class_name': '6', 'subjects': []}, 'subjects must be a non-empty list of subject ids or names'),
+        ({'class_name': '6', 'subjects': ['English'], 'action': 'drop'}, 'action must be enroll or unenroll'),
+        ({'student_ids': ['x'], 'subjects': ['English']}, 'student_ids must be a list of integers'),
+    ]
+    for payload, error in cases:
+        response = client.post('/teacher/enrollments', json=payload)
+        assert response.status_code == 400 and response.json['error'] == error
+
+
+def test_section_map_follows_a_section_change(app, client):
+    ids, subjects = _class(app, count=2)
+    login(client, 'teacher')
+    client.post('/teacher/enrollments', json={'class_name': '6', 'subjects': ['English']})
+    assert set(_map(client, **{'class': '6', 'section': 'A'})) == set(ids)
+    with app.app_context():
+        student = school.db.session.get(school.Student, ids[0])
+        student.section = 'B'
+        school.db.session.commit()
+    assert set(_map(client, **{'class': '6', 'section': 'A'})) == {ids[1]}
+    assert set(_map(client, **{'class': '6', 'section': 'B'})) == {ids[0]}
+
+
+def test_async_enrollment_runs_as_a_job(app, client):
+    app.config['JOBS_EAGER'] = True
+    ids, subjects = _class(app, count=2)
+    login(client, 'teacher')
+    response = client.post('/teacher/enrollments', json={'class_name': '6', 'subjects': ['Science'],
+                                                         'async': True})
+    assert response.status_code == 202
+    status = client.get(response.json['status_url'])
+    assert status.status_code == 200 and status.json['status'] == 'succeeded'
+    assert _map(client, **{'class': '6'}) == {sid: [subjects['Science']] for sid in ids}
@@ -0,0 +1,27 @@
+import os
+
+import app as school
+
+
+def _artifacts(app):
+    return sorted(os.listdir(app.config['EXPORTS_DIR']))
+
+
+def test_each_format_keeps_its_current_artifact(app):
+    with app.app_context():
+        csv_file = school.write_admin_export('students', {}, 'csv')['file']
+        gz_file = school.write_admin_export('students', {}, 'csv.gz')['file']
+        assert _artifacts(app) == sorted([csv_file, gz_file])
+        assert school.write_admin_export('students', {}, 'csv')['cached']
+        assert school.write_admin_export('students', {}, 'csv.gz')['cached']
+
+
+def test_new_version_replaces_only_its_own_format(app):
+    with app.app_context():
+        old_csv = school.write_admin_export('students', {}, 'csv')['file']
+        old_gz = school.write_admin_export('students', {}, 'csv.gz')['file']
+        school.db.session.add(school.Student(roll_no='X-1', name='New Student', password_hash='x'))
+        school.db.session.commit()
+        result = school.write_admin_export('students', {}, 'csv')
+        assert not result['cached'] and result['file'] != old_csv
+        assert _artifacts(app) == sorted([result['file'], old_gz])
@@ -0,0 +1,26 @@
+import app as school
+from conftest import login
+
+
+def test_each_call_builds_a_separate_app(app, tmp_path):
+    other = school.create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'other.db'}",
+                               'SCHOOL_AREAS': [], 'JOBS_RETRY_SECONDS': 7})
+    assert other is not app
+    assert other.config['JOBS_RETRY_SECONDS'] == 7 and app.config['JOBS_RETRY_SECONDS'] != 7
+    assert 'teacher_login' in app.view_functions
+    assert 'teacher_login' not in other.view_functions
+    # CLI commands come with the core blueprint whatever the areas
+    assert {'worker', 'enqueue', 'seed-scale'} <= set(other.cli.commands)
+
+
+def test_extra_areas_on_top_of_config(tmp_path):
+    app = school.create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'areas.db'}",
+                             'SCHOOL_AREAS': ['public']}, areas='teacher')
+    assert sorted(app.blueprints) == ['core', 'public', 'teacher']
+
+
+def test_pages_render(client):
+    assert client.get('/').status_code == 200
+    login(client, 'admin')
+    assert client.get('/admin/dashboard').status_code == 200
+    assert client.get('/admin/jobs?format=json').status_code == 200
@@ -0,0 +1,93 @@
+from datetime import date, datetime
+
+import sqlalchemy as sa
+
+import app as school
+from conftest import login
+
+
+def _student(roll_no, class_name='7', section='A'):
+    student = school.Student(roll_no=roll_no, name=roll_no, class_name=class_name, section=section,
+                             password_hash='x')
+    school.db.session.add(student)
+    school.db.session.commit()
+    return student.id
+
+
+def _schedule(class_name, name, amount, due):
+    school.db.session.add(school.FeeSchedule(class_name=class_name, academic_year=due.year, name=name,
+                                             amount=amount, due_date=due))
+    school.db.session.commit()
+
+
+def _balance(student_id):
+    return school.student_fee_summary(student_id)
+
+
+def test_payments_keep_ledger_and_balance_in_step(app):
+    with app.app_context():
+        sid = _student('FEE-1')
+        school.db.session.add(school.FeePayment(student_id=sid, amount=1500, mode='UPI'))
+        school.db.session.commit()
+        school.db.session.add(school.FeePayment(student_id=sid, amount=500, mode='Cash'))
+        school.db.session.commit()
+        assert _balance(sid) == {'charged': 0.0, 'paid': 2000.0, 'balance': -2000.0}
+        amounts = sorted(e.amount for e in school.FeeLedgerEntry.query.filter_by(student_id=sid))
+        assert amounts == [-1500.0, -500.0]
+
+
+def test_due_schedules_are_charged_once(app):
+    with app.app_context():
+        sid = _student('FEE-2')
+        other = _student('FEE-3', class_name='8')
+        _schedule('7', 'Term 1 fee', 5000, date(2025, 6, 15))
+        _schedule('7', 'Term 2 fee', 5000, date(2025, 10, 15))
+        school.db.session.add(school.FeePayment(student_id=sid, amount=2000))
+        school.db.session.commit()
+        assert school.post_fee_charges(as_of=date(2025, 7, 1)) == 1
+        assert school.post_fee_charges(as_of=date(2025, 7, 1)) == 0
+        assert _balance(sid) == {'charged': 5000.0, 'paid': 2000.0, 'balance': 3000.0}
+        assert _balance(other)['charged'] == 0.0
+        assert school.post_fee_charges(as_of=date(2025, 11, 1)) == 1
+        assert _balance(sid)['balance'] == 8000.0
+
+
+def test_reconcile_backfills_payments_written_outside_the_orm(app):
+    with app.app_context():
+        sid = _student('FEE-4')
+        school.db.session.execute(sa.insert(school.FeePayment.__table__).values(
+            student_id=sid, amount=750.0, date=datetime(2025, 7, 1)))
+        school.db.session.commit()
+        assert _balance(sid)['paid'] == 0.0
+        assert school.reconcile_fee_balances()['backfilled'] == 1
+        assert _balance(sid) == {'charged': 0.0, 'paid': 750.0, 'balance': -750.0}
+        assert school.reconcile_fee_balances()['backfilled'] == 0
+
+
+def test_dues_report_and_admin_page(app, client):
+    with app.app_context():
+        sid = _student('FEE-5')
+        _student('FEE-6')
+        _schedule('7', 'Term 1 fee', 5000, date(2025, 6, 15))
+        school.post_fee_charges(as_of=date(2025, 7, 1))
+        school.db.session.add(school.FeePayment(student_id=sid, amount=5000))
+        school.db.session.commit()
+        summary = [r for r in school.dues_report() if r['class_name'] == '7']
+        assert summary == [{'class_name': '7', 'section': 'A', 'students': 2, 'students_due': 1,
+                            'charged': 10000.0, 'paid': 5000.0, 'outstanding': 5000.0}]
+        assert [r['roll_no'] for r in school.dues_report('7')] == ['FEE-6']
+    login(client, 'admin')
+    response = client.get('/admin/fees?class=7&format=json')
+    assert response.status_code == 200
+    assert [r['roll_no'] for r in response.json['rows']] == ['FEE-6']
+    assert client.get('/admin/fees').status_code == 200
+
+
+def test_teacher_fee_form_updates_the_balance(app, client):
+    with app.app_context():
+        sid = _student('FEE-7')
+    login(client, 'teacher')
+    response = client.post('/teacher/fee', data={'student_id': sid, 'amount': '300', 'mode': 'Cash'})
+    assert response.status_code == 302
+    with app.app_context():
+        assert _balance(sid)['paid'] == 300.0
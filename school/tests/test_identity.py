@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import check_password_hash
+
+import app as school
+from conftest import login
+
+
+def _halves(username):
+    with school.db.session.no_autoflush:
+        teacher = school.Teacher.query.filter_by(username=username).first()
+        user = school.User.query.filter_by(username=username).first()
+    return teacher, user
+
+
+@contextmanager
+def _count_commits():
+    commits = []
+
+    def count(session):
+        commits.append(1)
+
+    sa.event.listen(school.db.session, 'after_commit', count)
+    try:
+        yield commits
+    finally:
+        sa.event.remove(school.db.session, 'after_commit', count)
+
+
+def test_failed_identity_write_keeps_neither_half(app):
+    with app.app_context():
+        school.db.session.add(school.User(role='student', username='clash', name='Clash', password_hash='x'))
+        school.db.session.commit()
+        with pytest.raises(IntegrityError):
+            school.create_identity('teacher', 'clash', 'Clash Teacher', 'pw')
+        school.db.session.rollback()
+        teacher, user = _halves('clash')
+        assert teacher is None and user.role == 'student'
+
+
+def test_admin_creates_a_teacher_in_one_commit(app, client):
+    login(client, 'admin')
+    with app.app_context(), _count_commits() as commits:
+        response = client.post('/admin/teachers/new', data={'username': 'newteacher', 'name': 'New Teacher'})
+        assert response.status_code == 302
+        assert len(commits) == 1
+        teacher, user = _halves('newteacher')
+        assert user.role == 'teacher'
+        assert teacher.password_hash == user.password_hash
+        assert check_password_hash(user.password_hash, teacher.initial_password)
+
+
+def test_username_taken_checks_the_role_table_and_users(app):
+    with app.app_context():
+        assert school.username_taken('teacher', 'teacher1')
+        assert school.username_taken('teacher', 'admin')  # only in users, under another role
+        assert not school.username_taken('teacher', 'nobody')
+
+
+def test_password_reset_and_delete_cover_both_halves(app, client):
+    login(client, 'admin')
+    with app.app_context():
+        school.create_identity('teacher', 'temp', 'Temp', 'old-password')
+        school.db.session.commit()
+    client.post('/admin/teachers/temp/reset_password')
+    with app.app_context():
+        teacher, user = _halves('temp')
+        assert teacher.password_hash == user.password_hash
+        assert not check_password_hash(user.password_hash, 'old-password')
+    client.post('/admin/teachers/temp/delete')
+    with app.app_context():
+        assert _halves('temp') == (None, None)
+
+
+def test_confirming_an_admission_creates_the_student_and_user(app, client):
+    login(client, 'admin')
+    with app.app_context():
+        adm = school.Admission(status='pending', name='Asha Rao', class_name='5', section='A')
+        school.db.session.add(adm)
+        school.db.session.commit()
+        adm_id = adm.id
+    client.post(f'/admin/admissions/{adm_id}/status', data={'status': 'confirmed', 'roll_no': 'ADM-9'})
+    with app.app_context():
+        adm = school.db.session.get(school.Admission, adm_id)
+        student = school.Student.query.filter_by(roll_no='ADM-9').one()
+        user = school.User.query.filter_by(username='ADM-9').one()
+        assert adm.student_id == student.id and user.role == 'student'
+        assert student.password_hash == user.password_hash
+        assert check_password_hash(student.password_hash, adm.password)
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import app as school
+from conftest import login
+
+
+def _slow_job(monkeypatch, seconds):
+    calls = []
+
+    def handler(ctx):
+        calls.append(ctx.worker)
+        time.sleep(seconds)
+        return {'slept': seconds}
+    monkeypatch.setitem(school.JOB_HANDLERS, 'test.slow', handler)
+    return calls
+
+
+def test_long_job_outlives_short_stale_window(app, monkeypatch):
+    # The job runs longer than JOBS_STALE_SECONDS: only its heartbeat keeps a
+    # second worker, which reaps stale jobs every 1.5 s, from requeueing it
+    app.config['JOBS_STALE_SECONDS'] = 3
+    calls = _slow_job(monkeypatch, 4.5)
+    real_tenant_context, failures = school.tenant_context, []
+
+    def flaky_tenant_context(*args, **kwargs):
+        if threading.current_thread() is not threading.main_thread() and not failures:
+            failures.append(1)
+            raise RuntimeError('first beat fails')
+        return real_tenant_context(*args, **kwargs)
+    monkeypatch.setattr(school, 'tenant_context', flaky_tenant_context)
+
+    with app.app_context():
+        job_id = school.enqueue_job('test.slow').id
+        assert school.claim_job('w1') == job_id
+
+    stop = threading.Event()
+
+    def second_worker():
+        with app.app_context():
+            school.run_worker(name='w2', poll=0.2, stop=stop, log=lambda line: None)
+    other = threading.Thread(target=second_worker)
+    other.start()
+    try:
+        with app.app_context():
+            outcome = school.run_job(job_id, 'w1')
+    finally:
+        stop.set()
+        other.join()
+
+    assert failures, 'the heartbeat never hit the injected error'
+    assert outcome == 'succeeded'
+    assert calls == ['w1']
+    with app.app_context():
+        job = school.db.session.get(school.Job, job_id)
+        assert (job.status, job.attempts, job.worker) == ('succeeded', 1, 'w1')
+
+
+def _reporting_job(monkeypatch):
+    def handler(ctx):
+        ctx.progress(1, 2, 'half way', force=True)
+        return {'done': True}
+    monkeypatch.setitem(school.JOB_HANDLERS, 'test.report', handler)
+
+
+def test_cancel_queued_job(app, client, monkeypatch):
+    _reporting_job(monkeypatch)
+    with app.app_context():
+        job_id = school.enqueue_job('test.report').id
+    login(client, 'admin')
+    client.post(f'/admin/jobs/{job_id}/cancel')
+    with app.app_context():
+        assert school.db.session.get(school.Job, job_id).status == 'cancelled'
+        assert school.claim_job('w1') is None
+
+
+def test_cancel_after_a_worker_claimed_the_job(app, client, monkeypatch):
+    # The admin saw the job queued, but a worker claimed it before the cancel arrived
+    _reporting_job(monkeypatch)
+    with app.app_context():
+        job_id = school.enqueue_job('test.report').id
+        assert school.claim_job('w1') == job_id
+    login(client, 'admin')
+    client.post(f'/admin/jobs/{job_id}/cancel')
+    with app.app_context():
+        job = school.db.session.get(school.Job, job_id)
+        assert (job.status, job.cancel_requested) == ('running', True)
+        assert school.run_job(job_id, 'w1') == 'cancelled'
+
+
+def test_cancel_finished_job_changes_nothing(app, monkeypatch):
+    _reporting_job(monkeypatch)
+    with app.app_context():
+        job_id = school.enqueue_job('test.report').id
+        school.run_job(school.claim_job('w1'), 'w1')
+        assert school.cancel_job(job_id) is None
+        assert school.db.session.get(school.Job, job_id).status == 'succeeded'
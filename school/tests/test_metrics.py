@@ -0,0 +1,59 @@
+import json
+import os
+
+import app as school
+from conftest import login
+
+
+def _sample(body: str, prefix: str) -> float:
+    """Value of the exposition line starting with `prefix` (0 when absent)."""
+    for line in body.splitlines():
+        if line.startswith(prefix + ' '):
+            return float(line.rsplit(' ', 1)[1])
+    return 0.0
+
+
+def test_metrics_need_an_admin_session_or_the_token(app, client):
+    app.config['METRICS_TOKEN'] = 's3cret'
+    assert client.get('/admin/metrics').status_code == 401
+    assert client.get('/admin/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    response = client.get('/admin/metrics', headers={'Authorization': 'Bearer s3cret'})
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    assert '# TYPE school_http_request_duration_seconds histogram' in response.get_data(as_text=True)
+    login(client, 'admin')
+    assert client.get('/admin/metrics').status_code == 200
+
+
+def test_no_token_configured_means_session_only(app, client):
+    app.config['METRICS_TOKEN'] = None
+    assert client.get('/admin/metrics', headers={'Authorization': 'Bearer '}).status_code == 401
+    assert client.get('/admin/metrics', headers={'Authorization': 'Bearer None'}).status_code == 401
+
+
+def test_requests_and_logins_are_counted(app, client):
+    login(client, 'admin')
+    requests = 'school_http_requests_total{endpoint="admin_login",method="GET",status="200"}'
+    failures = 'school_logins_total{outcome="failure",role="admin"}'
+    before = client.get('/admin/metrics').get_data(as_text=True)
+    client.get('/admin/login')
+    client.post('/admin/login', data={'username': 'admin', 'password': 'wrong'})
+    after = client.get('/admin/metrics').get_data(as_text=True)
+    assert _sample(after, requests) == _sample(before, requests) + 1
+    assert _sample(after, failures) == _sample(before, failures) + 1
+    assert 'school_http_request_duration_seconds_bucket{endpoint="admin_login",le="+Inf"}' in after
+
+
+def test_scrape_sums_the_worker_files(app, client, tmp_path):
+    app.config['METRICS_DIR'] = str(tmp_path / 'metrics')
+    login(client, 'admin')
+    other = school.MetricsRegistry()
+    other.inc('school_export_rows_total', {'export': 'students'}, 5)
+    os.makedirs(app.config['METRICS_DIR'], exist_ok=True)
+    with open(os.path.join(app.config['METRICS_DIR'], 'metrics_1.json'), 'w') as fh:
+        json.dump(other.snapshot(), fh)
+    rows = 'school_export_rows_total{export="students"}'
+    own = _sample(school.metrics.render([school.metrics.snapshot()]), rows)
+    body = client.get('/admin/metrics').get_data(as_text=True)
+    assert _sample(body, rows) == own + 5
+    assert os.path.exists(os.path.join(app.config['METRICS_DIR'], f"metrics_{os.getpid()}.json"))
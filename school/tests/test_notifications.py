@@ -0,0 +1,48 @@
+from datetime import date, datetime
+
+import app as school
+
+
+class _DownTransport:
+    def send_batch(self, messages):
+        raise ConnectionError('gateway down')
+
+
+def _queue_absence(student, on_date):
+    school.db.session.add(school.Attendance(student_id=student.id, date=on_date, status='Absent'))
+    school.db.session.add(school.NotificationOutbox(student_id=student.id, event_date=on_date, channel='sms',
+                                                    recipient='9876543210'))
+    school.db.session.commit()
+
+
+def test_failed_send_queues_a_dispatch_for_its_retry(app, monkeypatch):
+    monkeypatch.setitem(school.NOTIFY_TRANSPORTS, 'file', _DownTransport)
+    app.config['NOTIFY_RETRY_SECONDS'] = 60
+    with app.app_context():
+        _queue_absence(school.Student.query.first(), date(2020, 1, 6))
+        first_id = school.enqueue_job('notifications.dispatch').id
+        assert school.run_worker(name='w1', kinds=['notifications.dispatch'], once=True, log=lambda *a: None) == 1
+
+        row = school.NotificationOutbox.query.one()
+        assert (row.status, row.attempts) == ('pending', 1)
+        follow_up = school.Job.query.filter(school.Job.kind == 'notifications.dispatch',
+                                            school.Job.id != first_id).one()
+        assert follow_up.status == 'queued'
+        assert abs((follow_up.run_after - row.next_attempt_at).total_seconds()) < 2
+        assert follow_up.run_after > datetime.utcnow()
+
+
+def test_follow_up_not_queued_when_outbox_is_drained(app):
+    with app.app_context():
+        _queue_absence(school.Student.query.first(), date(2020, 1, 6))
+        school.enqueue_job('notifications.dispatch')
+        school.run_worker(name='w1', kinds=['notifications.dispatch'], once=True, log=lambda *a: None)
+        assert school.NotificationOutbox.query.one().status == 'sent'
+        assert school.Job.query.filter_by(kind='notifications.dispatch', status='queued').count() == 0
+
+
+def test_bad_float_setting_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv('NOTIFY_RATE_PER_SECOND', 'fast')
+    assert school._env_float('NOTIFY_RATE_PER_SECOND', 20.0) == 20.0
+    monkeypatch.setenv('NOTIFY_RATE_PER_SECOND', ' 2.5 ')
+    assert school._env_float('NOTIFY_RATE_PER_SECOND', 20.0) == 2.5
@@ -0,0 +1,43 @@
+import threading
+
+import pytest
+import sqlalchemy as sa
+
+import app as school
+
+
+def test_failed_statement_leaves_no_start_time_behind(app):
+    with app.app_context():
+        with school.db.engine.connect() as conn:
+            with pytest.raises(sa.exc.OperationalError):
+                conn.execute(sa.text('SELECT * FROM no_such_table'))
+            assert conn.info.get('query_start') == []
+            with school.query_capture() as prof:
+                conn.execute(sa.text('SELECT 1'))
+            assert prof.count == 1 and prof.total_time < 1
+
+
+def test_tenant_engines_get_the_error_listener(app, tmp_path):
+    app.config['TENANTS'] = {'greenfield': f"sqlite:///{tmp_path / 'greenfield.db'}"}
+    with app.app_context():
+        engine = school._create_tenant_engine('greenfield')
+        try:
+            assert sa.event.contains(engine, 'handle_error', school._on_cursor_error)
+        finally:
+            engine.dispose()
+
+
+def test_capture_ignores_statements_from_other_threads(app):
+    def other_thread():
+        with app.app_context():
+            for _ in range(5):
+                school.db.session.execute(sa.text('SELECT 1'))
+            school.db.session.remove()
+
+    with app.app_context():
+        with school.assert_max_queries(1) as prof:
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join()
+            school.db.session.execute(sa.text('SELECT 2'))
+        assert prof.count == 1
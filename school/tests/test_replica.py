@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+import app as school
+from conftest import login
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """An app whose 'replica' bind is a second SQLite file, synced by sync_replica()."""
+    application = school.create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'school.db'}",
+        'SQLALCHEMY_BINDS': {'replica': f"sqlite:///{tmp_path / 'replica.db'}"},
+        'REPLICA_STICKY_SECONDS': 60,
+        'CACHE_BACKEND': 'memory',
+        'EXPORTS_DIR': str(tmp_path / 'exports'),
+        'NOTIFY_FILE': str(tmp_path / 'notifications.jsonl'),
+        'METRICS_DIR': None,
+    })
+    with application.app_context():
+        school.ensure_db_and_sample()
+        school.db.session.commit()
+    yield application
+    with application.app_context():
+        school.db.session.remove()
+        for engine in school.db.engines.values():
+            engine.dispose()
+
+
+def sync_replica(app):
+    with app.app_context():
+        primary, replica = school.db.engine, school.db.engines['replica']
+        replica.dispose()
+        with sqlite3.connect(primary.url.database) as src, sqlite3.connect(replica.url.database) as dst:
+            src.backup(dst)
+
+
+def _add_student(app, name):
+    with app.app_context():
+        school.db.session.add(school.Student(roll_no=name.upper(), name=name, password_hash='x'))
+        school.db.session.commit()
+
+
+def _read_from_replica(client):
+    with client.session_transaction() as sess:
+        sess.pop('primary_until', None)
+
+
+def _listed(client, name):
+    response = client.get('/admin/students?use_admissions=0')
+    assert response.status_code == 200
+    return name in response.get_data(as_text=True)
+
+
+def test_replica_reads_go_to_the_replica(replica_app):
+    client = login(replica_app.test_client(), 'admin')
+    sync_replica(replica_app)
+    _add_student(replica_app, 'Lagging')
+    _read_from_replica(client)
+    assert not _listed(client, 'Lagging')
+    sync_replica(replica_app)
+    assert _listed(client, 'Lagging')
+
+
+def test_browser_reads_the_primary_after_a_write(replica_app):
+    client = replica_app.test_client()
+    sync_replica(replica_app)
+    _add_student(replica_app, 'Fresh')
+    login(client, 'admin')  # a successful POST
+    assert _listed(client, 'Fresh')
+    _read_from_replica(client)
+    assert not _listed(client, 'Fresh')
+
+
+def test_eager_job_in_a_replica_view_runs_on_the_primary(replica_app):
+    replica_app.config['JOBS_EAGER'] = True
+    client = login(replica_app.test_client(), 'admin')
+    sync_replica(replica_app)
+    _read_from_replica(client)
+    response = client.get('/admin/students/export?async=1')
+    assert response.status_code == 302
+    assert '/admin/exports/files/' in response.headers['Location']
+    with replica_app.app_context():
+        job = school.db.session.execute(school.db.select(school.Job)).scalar_one()
+        assert job.status == 'succeeded'
@@ -0,0 +1,56 @@
+import app as school
+
+SMALL = ['--classes', '2', '--sections', '2', '--students', '3', '--teachers', '2', '--batch', '50']
+
+
+def _seed(app, *args):
+    result = app.test_cli_runner().invoke(args=['seed-scale', *SMALL, *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_seed_scale_fills_every_table_and_the_counters(app):
+    with app.app_context():
+        before = school.db.session.query(school.Student).count()
+    output = _seed(app)
+    assert 'Inserted' in output
+    with app.app_context():
+        assert school.db.session.query(school.Student).count() == before + 12
+        assert school.db.session.query(school.Teacher).filter(school.Teacher.username.like('t42_%')).count() == 2
+        assert school.db.session.query(school.Attendance).count() > 0
+        assert school.db.session.query(school.FeeLedgerEntry).count() > 0
+        assert school.dashboard_counters()['students'] == before + 12
+
+
+def test_generated_accounts_can_log_in(app, client):
+    _seed(app)
+    response = client.post('/student/login', data={'roll_no': '42-01A-001', 'password': 'password123'})
+    assert response.status_code == 302
+
+
+def _seeded_students(app):
+    _seed(app)
+    with app.app_context():
+        return [(s.roll_no, s.name, s.phone) for s in
+                school.Student.query.filter(school.Student.roll_no.like('42-%')).order_by(school.Student.roll_no)]
+
+
+def test_same_seed_generates_the_same_data(app, tmp_path):
+    other = school.create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'other.db'}",
+                               'CACHE_BACKEND': 'memory', 'METRICS_DIR': None})
+    try:
+        assert _seeded_students(app) == _seeded_students(other)
+    finally:
+        with other.app_context():
+            for engine in school.db.engines.values():
+                engine.dispose()
+
+
+def test_another_seed_adds_its_own_rows_and_reuses_sections(app):
+    _seed(app)
+    with app.app_context():
+        sections = school.db.session.query(school.ClassSection).count()
+    _seed(app, '--seed', '7')
+    with app.app_context():
+        assert school.db.session.query(school.ClassSection).count() == sections
+        assert school.Student.query.filter(school.Student.roll_no.like('7-%')).count() == 12
@@ -0,0 +1,65 @@
+import logging
+import time
+
+import app as school
+from conftest import login
+
+
+def _sports_version():
+    return school.counter_version('sports_version')
+
+
+def test_bulk_save_bumps_the_version_once(app, client):
+    with app.app_context():
+        school.db.session.add_all([school.Student(roll_no=f"S{n}", name=f"Student {n}", password_hash='x')
+                                   for n in range(3)])
+        school.db.session.commit()
+        ids = [str(i) for (i,) in school.db.session.query(school.Student.id)]
+        before = _sports_version()
+    login(client, 'teacher')
+    client.post('/teacher/sports/bulk', data={'student_id': ids, 'activity': 'Chess', 'level': 'State',
+                                              'result': '1st', 'date': '2025-01-10'})
+    with app.app_context():
+        assert school.SportsActivity.query.filter_by(activity='Chess').count() == len(ids) > 1
+        assert _sports_version() == before + 1
+
+
+def test_edits_and_deletes_bump_the_version(app):
+    with app.app_context():
+        student = school.Student.query.first()
+        activity = school.SportsActivity(student_id=student.id, activity='Relay', result='2nd')
+        school.db.session.add(activity)
+        school.db.session.commit()
+        before = _sports_version()
+        activity.result = '1st'
+        school.db.session.commit()
+        assert _sports_version() == before + 1
+        school.db.session.delete(activity)
+        school.db.session.commit()
+        assert _sports_version() == before + 2
+        school.db.session.add(school.Subject(name='Sculpture'))
+        school.db.session.commit()
+        assert _sports_version() == before + 2
+
+
+def test_bad_weight_entries_are_skipped_and_logged(monkeypatch, caplog):
+    monkeypatch.setenv('SPORTS_LEVEL_WEIGHTS', 'School=1, Zonal=two,=3,State, National=8.5,')
+    with caplog.at_level(logging.WARNING):
+        weights = school._env_weights('SPORTS_LEVEL_WEIGHTS', {}, logging.getLogger('school-test'))
+    assert weights == {'School': 1.0, 'National': 8.5}
+    assert [r.getMessage() for r in caplog.records] == [
+        "SPORTS_LEVEL_WEIGHTS: ignoring 'Zonal=two' (expected name=number)",
+        "SPORTS_LEVEL_WEIGHTS: ignoring '=3' (expected name=number)",
+        "SPORTS_LEVEL_WEIGHTS: ignoring 'State' (expected name=number)",
+    ]
+
+
+def test_version_read_inside_a_write_transaction_does_not_block(app):
+    with app.app_context():
+        school.db.session.add(school.SportsActivity(student_id=school.Student.query.first().id, activity='Swim'))
+        school.db.session.flush()  # the session now holds SQLite's write lock
+        started = time.monotonic()
+        assert school.counter_version('not_written_yet_version') == 0
+        assert time.monotonic() - started < 1
+        school.db.session.commit()
+        assert school.counter_version('sports_version') >= 1
@@ -0,0 +1,30 @@
+import logging
+import threading
+
+import app as school
+
+
+def test_pragmas_apply_to_connections_made_outside_an_app_context(app):
+    with app.app_context():
+        engine = school.db.engine
+    engine.dispose()
+    seen = {}
+
+    def connect():
+        with engine.connect() as conn:
+            seen['journal_mode'] = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+            seen['busy_timeout'] = conn.exec_driver_sql('PRAGMA busy_timeout').scalar()
+
+    worker = threading.Thread(target=connect)
+    worker.start()
+    worker.join()
+    assert seen == {'journal_mode': 'wal', 'busy_timeout': 5000}
+
+
+def test_pragma_values_are_validated_before_they_reach_sql(caplog):
+    statements = school.sqlite_pragma_statements({
+        'journal_mode': 'wal', 'busy_timeout': '2500', 'cache_size': '1; DROP TABLE students',
+        'synchronous': 'NORMAL; DROP TABLE students', 'temp_store': None, 'key': 'secret',
+    }, logging.getLogger('school-test'))
+    assert statements == ['PRAGMA journal_mode=WAL', 'PRAGMA busy_timeout=2500']
+    assert len(caplog.records) == 3
@@ -0,0 +1,25 @@
+"""Importing app.py stays cheap and side-effect free; create_app() does the work."""
+import os
+import statistics
+
+import bench_startup
+
+# Median time for the app.py module body in a fresh interpreter (bytecode already written)
+APP_IMPORT_BUDGET_MS = float(os.environ.get('APP_IMPORT_BUDGET_MS') or 150)
+IMPORT_TOTAL_BUDGET_MS = float(os.environ.get('IMPORT_TOTAL_BUDGET_MS') or 1000)
+
+
+def test_import_loads_no_areas_and_touches_no_database(tmp_path):
+    run = bench_startup.probe(str(tmp_path / 'fresh.db'))
+    assert run['on_import'] == {'areas': [], 'database': False}
+    assert run['routes'] > 50  # create_app() then registered every area
+
+
+def test_import_within_budget(tmp_path):
+    db_path = str(tmp_path / 'startup.db')
+    bench_startup.probe(db_path)  # warm-up: bytecode and schema
+    runs = [bench_startup.probe(db_path) for _ in range(5)]
+    app_ms = statistics.median(r['app'] for r in runs) * 1000
+    total_ms = statistics.median(r['deps'] + r['app'] for r in runs) * 1000
+    assert app_ms <= APP_IMPORT_BUDGET_MS, f"app.py body {app_ms:.1f}ms > {APP_IMPORT_BUDGET_MS:.0f}ms"
+    assert total_ms <= IMPORT_TOTAL_BUDGET_MS, f"import total {total_ms:.1f}ms > {IMPORT_TOTAL_BUDGET_MS:.0f}ms"
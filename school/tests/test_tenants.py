@@ -0,0 +1,49 @@
+import sqlalchemy as sa
+from flask import g
+
+import app as school
+
+
+def _add_tenant(app, tmp_path, tenant):
+    app.config['TENANTS'] = {**app.config['TENANTS'], tenant: f"sqlite:///{tmp_path / tenant}.db"}
+
+
+def test_tenant_keeps_its_replica_bind(app, tmp_path):
+    _add_tenant(app, tmp_path, 'northside')
+    app.config['TENANT_BINDS'] = {'replica': f"sqlite:///{tmp_path}/{{tenant}}-replica.db"}
+    try:
+        with school.tenant_context('northside', app):
+            engines = school.db.engines
+            assert set(engines) == {None, 'replica'}
+            assert engines['replica'].url.database == str(tmp_path / 'northside-replica.db')
+            assert engines[None].url.database == str(tmp_path / 'northside.db')
+        with app.test_request_context('/'):
+            g.tenant, g.use_replica = 'northside', True
+            assert school._replica_configured()
+            bind = school.db.session.get_bind(clause=sa.select(school.Student))
+            assert bind.url.database == str(tmp_path / 'northside-replica.db')
+    finally:
+        school.tenant_engines.dispose_all()
+
+
+def test_default_replica_is_not_used_for_a_tenant(app, tmp_path):
+    _add_tenant(app, tmp_path, 'westbrook')
+    try:
+        with app.test_request_context('/'):
+            g.tenant = 'westbrook'
+            assert not school._replica_configured()
+            assert 'replica' not in school.db.engines
+    finally:
+        school.tenant_engines.dispose_all()
+
+
+def test_schema_guard_returns_the_tables_it_created(app, tmp_path):
+    _add_tenant(app, tmp_path, 'eastfield')
+    try:
+        with school.tenant_context('eastfield', app):
+            assert school._ensure_new_tables_and_indexes() == set()
+            school.FeeLedgerEntry.__table__.drop(school.db.engine)
+            assert school._ensure_new_tables_and_indexes() == {'fee_ledger'}
+            assert school._ensure_class_section_columns() == set()
+    finally:
+        school.tenant_engines.dispose_all()